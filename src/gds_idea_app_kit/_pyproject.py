@@ -0,0 +1,33 @@
+"""Shared reader for the [tool.webapp] section of a project's pyproject.toml.
+
+Several commands (smoke-test, provide-role, migrate) only need the app's
+[tool.webapp] configuration, so they read it through this one helper rather
+than each opening and parsing the file themselves.
+"""
+
+import sys
+import tomllib
+from pathlib import Path
+
+import click
+
+
+def load_webapp_config(project_dir: Path) -> dict:
+    """Read the [tool.webapp] table from pyproject.toml.
+
+    Exits with an error if pyproject.toml does not exist.
+
+    Args:
+        project_dir: The project root directory.
+
+    Returns:
+        The [tool.webapp] table as a dict (empty if the section is missing).
+    """
+    try:
+        content = (project_dir / "pyproject.toml").read_text(encoding="utf-8")
+    except FileNotFoundError:
+        click.echo("Error: No pyproject.toml found. Are you in a project root?", err=True)
+        sys.exit(1)
+
+    config = tomllib.loads(content)
+    return config.get("tool", {}).get("webapp", {})
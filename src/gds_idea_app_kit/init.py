@@ -4,6 +4,7 @@ Scaffolds a new project by running cdk init, uv init, copying template files,
 installing dependencies, and making the initial commit.
 """
 
+import functools
 import re
 import shutil
 import subprocess
@@ -23,6 +24,10 @@ from gds_idea_app_kit import (
 from gds_idea_app_kit.manifest import build_manifest, write_manifest
 from gds_idea_app_kit.prerequisites import check_prerequisites
 
+# A valid app name in one pass: a DNS label of at most 63 lowercase alphanumerics
+# and hyphens, starting and ending alphanumeric, with no "--" and not all digits.
+_APP_NAME_RE = re.compile(r"(?!\d+\Z)(?!.*--)[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?")
+
 
 def _sanitize_app_name(name: str) -> str:
     """Sanitize and validate an app name for use as a DNS subdomain label.
@@ -46,37 +51,63 @@ def _sanitize_app_name(name: str) -> str:
     # Lowercase
     name = name.lower()
 
-    # Validate DNS label rules
+    # _APP_NAME_RE alone decides whether the name is valid
+    if _APP_NAME_RE.fullmatch(name):
+        return name
+
+    # The name was rejected; pick the most specific message for why
     if not name:
         raise click.BadParameter("App name cannot be empty.")
 
     if len(name) > 63:
         raise click.BadParameter("App name must be 63 characters or fewer (DNS label limit).")
 
-    if not re.match(r"^[a-z0-9]([a-z0-9-]*[a-z0-9])?$", name):
-        raise click.BadParameter(
-            "App name must contain only lowercase letters, numbers, and hyphens, "
-            "and must start and end with a letter or number."
-        )
+    if name.isdigit():
+        raise click.BadParameter("App name must not be purely numeric.")
 
     if "--" in name:
         raise click.BadParameter("App name must not contain consecutive hyphens (--).")
 
-    if name.isdigit():
-        raise click.BadParameter("App name must not be purely numeric.")
-
-    return name
+    raise click.BadParameter(
+        "App name must contain only lowercase letters, numbers, and hyphens, "
+        "and must start and end with a letter or number."
+    )
 
 
+@functools.cache
 def _get_templates_dir() -> Path:
-    """Get the path to the bundled templates directory."""
+    """Get the path to the bundled templates directory.
+
+    The location is fixed for the lifetime of the process, so it is resolved once.
+    """
     return Path(str(files("gds_idea_app_kit") / "templates"))
 
 
+# Matches a {{placeholder}}; the name is captured so re.split keeps it.
+_PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+
+
+def _parse_template(content: str) -> tuple[str, ...]:
+    """Split template content into alternating literal text and placeholder names.
+
+    Even indices are literal fragments and odd indices are placeholder names,
+    e.g. "FROM python:{{python_version}}-slim" becomes
+    ("FROM python:", "python_version", "-slim").
+
+    Args:
+        content: The template content with {{placeholders}}.
+
+    Returns:
+        The interleaved literal/placeholder segments.
+    """
+    return tuple(_PLACEHOLDER_RE.split(content))
+
+
 def _apply_template_vars(content: str, variables: dict[str, str]) -> str:
     """Apply template variable substitution to content.
 
-    Replaces {{key}} with value for each entry in variables.
+    Replaces {{key}} with value for each entry in variables. Placeholders with
+    no matching variable are left as-is.
 
     Args:
         content: The template content with {{placeholders}}.
@@ -85,24 +116,44 @@ def _apply_template_vars(content: str, variables: dict[str, str]) -> str:
     Returns:
         Content with all placeholders replaced.
     """
-    for key, value in variables.items():
-        content = content.replace(f"{{{{{key}}}}}", value)
-    return content
+    # Most templates have no placeholders at all; skip parsing entirely.
+    if not variables or "{{" not in content:
+        return content
+    parts = _parse_template(content)
+    return "".join(
+        variables.get(part, f"{{{{{part}}}}}") if i % 2 else part for i, part in enumerate(parts)
+    )
 
 
-def _copy_template(src: Path, dest: Path, variables: dict[str, str] | None = None) -> None:
+def _copy_template(
+    src: Path,
+    dest: Path,
+    variables: dict[str, str] | None = None,
+    created_dirs: set[Path] | None = None,
+) -> None:
     """Copy a template file to a destination, optionally applying variable substitution.
 
     Args:
         src: Path to the source template file.
         dest: Path to the destination file.
         variables: Optional mapping of placeholder names to values.
+        created_dirs: Optional set of directories already known to exist. When given,
+            the parent directory is only created if it isn't in the set, and is added
+            to it afterwards.
     """
-    dest.parent.mkdir(parents=True, exist_ok=True)
+    if created_dirs is None:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+    elif dest.parent not in created_dirs:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        created_dirs.add(dest.parent)
+
+    # Untemplated files are copied byte-for-byte, without decoding to str
+    if not variables:
+        shutil.copyfile(src, dest)
+        return
+
     content = src.read_text()
-    if variables:
-        content = _apply_template_vars(content, variables)
-    dest.write_text(content)
+    dest.write_text(_apply_template_vars(content, variables))
 
 
 def _run_command(
@@ -119,11 +170,12 @@ def _run_command(
             If not provided, uses cwd.
 
     Returns:
-        The completed process result.
+        The completed process result, with stdout and stderr as bytes.
     """
     cleanup_dir = project_dir or cwd
     try:
-        return subprocess.run(cmd, cwd=cwd, check=True, capture_output=True, text=True)
+        # Output is captured as bytes; it is only decoded on the error path.
+        return subprocess.run(cmd, cwd=cwd, check=True, capture_output=True)
     except FileNotFoundError:
         if cmd[0] == "cdk":
             click.echo("Error: 'cdk' is not installed.", err=True)
@@ -137,7 +189,7 @@ def _run_command(
     except subprocess.CalledProcessError as e:
         click.echo(f"Error running: {' '.join(cmd)}", err=True)
         if e.stderr:
-            click.echo(e.stderr, err=True)
+            click.echo(e.stderr.decode(errors="replace"), err=True)
         click.echo("", err=True)
         click.echo("To clean up the failed project:", err=True)
         click.echo(f"  rm -rf {cleanup_dir}", err=True)
@@ -253,24 +305,31 @@ def run_init(framework: str, app_name: str, python_version: str) -> None:
         "year": str(datetime.now().year),
     }
     templates = _get_templates_dir()
+    created_dirs: set[Path] = {project_dir}
 
     # -- Copy app.py (CDK entry point) --
     click.echo("Copying template files...")
-    _copy_template(templates / "common" / "app.py", project_dir / "app.py")
+    _copy_template(
+        templates / "common" / "app.py", project_dir / "app.py", created_dirs=created_dirs
+    )
 
     # -- Copy framework files into app_src/ --
     app_src = project_dir / "app_src"
     app_src.mkdir(exist_ok=True)
+    created_dirs.add(app_src)
 
     # Framework app file (e.g. streamlit_app.py)
     framework_app = f"{framework}_app.py"
-    _copy_template(templates / framework / framework_app, app_src / framework_app)
+    _copy_template(
+        templates / framework / framework_app, app_src / framework_app, created_dirs=created_dirs
+    )
 
     # Dockerfile (has template vars for python version)
     _copy_template(
         templates / framework / "Dockerfile",
         app_src / "Dockerfile",
         variables=template_vars,
+        created_dirs=created_dirs,
     )
 
     # App pyproject.toml (from .toml.template with substitution)
@@ -278,41 +337,49 @@ def run_init(framework: str, app_name: str, python_version: str) -> None:
         templates / framework / "pyproject.toml.template",
         app_src / "pyproject.toml",
         variables=template_vars,
+        created_dirs=created_dirs,
     )
 
     # -- Copy CI/CD workflow --
     _copy_template(
         templates / "common" / "ci_cd_cdk_app.yml",
         project_dir / ".github" / "workflows" / "ci_cd_cdk_app.yml",
+        created_dirs=created_dirs,
     )
 
     # -- Copy CI (PR) workflow --
     _copy_template(
         templates / "common" / "ci_pr_cdk_app.yml",
         project_dir / ".github" / "workflows" / "ci_pr_cdk_app.yml",
+        created_dirs=created_dirs,
     )
 
     # -- Copy Dependabot config --
     _copy_template(
         templates / "common" / "dependabot.yml",
         project_dir / ".github" / "dependabot.yml",
+        created_dirs=created_dirs,
     )
 
     # -- Copy .devcontainer/ files --
     _copy_template(
         templates / "common" / "devcontainer.json",
         project_dir / ".devcontainer" / "devcontainer.json",
+        created_dirs=created_dirs,
     )
     _copy_template(
         templates / "common" / "docker-compose.yml",
         project_dir / ".devcontainer" / "docker-compose.yml",
+        created_dirs=created_dirs,
     )
 
     # -- Copy dev_mocks/ --
     dev_mocks_src = templates / "dev_mocks"
     for mock_file in dev_mocks_src.iterdir():
         if mock_file.is_file():
-            _copy_template(mock_file, project_dir / "dev_mocks" / mock_file.name)
+            _copy_template(
+                mock_file, project_dir / "dev_mocks" / mock_file.name, created_dirs=created_dirs
+            )
 
     # -- Append to .gitignore --
     gitignore = project_dir / ".gitignore"
@@ -326,6 +393,7 @@ def run_init(framework: str, app_name: str, python_version: str) -> None:
         templates / "common" / "LICENCE",
         project_dir / "LICENCE",
         variables=template_vars,
+        created_dirs=created_dirs,
     )
 
     # -- Copy README --
@@ -333,6 +401,7 @@ def run_init(framework: str, app_name: str, python_version: str) -> None:
         templates / "common" / "README.md.template",
         project_dir / "README.md",
         variables=template_vars,
+        created_dirs=created_dirs,
     )
 
     # -- Install CDK dependencies --
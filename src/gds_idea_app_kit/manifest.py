@@ -6,6 +6,9 @@ The manifest lives in pyproject.toml under the [tool.gds-idea-app-kit] section a
 """
 
 import hashlib
+import os
+import tomllib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import tomlkit
@@ -33,65 +36,156 @@ FRAMEWORK_OWNED_FILES = {
 }
 
 
-def hash_file(path: Path) -> str:
-    """Compute SHA256 hash of a file.
+HASH_ALGORITHM = "sha256"
+
+# Algorithms a manifest hash may be recorded with. Manifests are only ever written
+# with HASH_ALGORITHM; any other prefix is treated as not matching.
+SUPPORTED_HASH_ALGORITHMS = frozenset({HASH_ALGORITHM})
+
+
+def hash_file(path: Path, algorithm: str = HASH_ALGORITHM) -> str:
+    """Compute the hash of a file.
 
     Args:
         path: Path to the file to hash.
+        algorithm: Name of the hashlib algorithm to use. Defaults to SHA256, which is
+            what new manifests are written with.
 
     Returns:
-        Hash string in the format "sha256:<hex_digest>".
+        Hash string in the format "<algorithm>:<hex_digest>" (e.g. "sha256:...").
     """
-    content = path.read_bytes()
-    digest = hashlib.sha256(content).hexdigest()
-    return f"sha256:{digest}"
+    with open(path, "rb") as f:
+        digest = hashlib.file_digest(f, algorithm).hexdigest()
+    return f"{algorithm}:{digest}"
 
 
-def get_tracked_files(framework: str) -> dict[str, str]:
-    """Get the full mapping of template source -> project destination for a framework.
+def hash_bytes(data: bytes, algorithm: str = HASH_ALGORITHM) -> str:
+    """Compute the hash of in-memory content, in the same format as hash_file.
 
     Args:
-        framework: The framework name (streamlit, dash, fastapi).
+        data: The content to hash.
+        algorithm: Name of the hashlib algorithm to use.
+
+    Returns:
+        Hash string in the format "<algorithm>:<hex_digest>".
+    """
+    return f"{algorithm}:{hashlib.new(algorithm, data).hexdigest()}"
+
+
+def hash_matches(path: Path, expected: str) -> bool:
+    """Check whether a file's content matches a manifest hash.
+
+    The file is hashed with the algorithm the expected hash is prefixed with.
+    A prefix outside SUPPORTED_HASH_ALGORITHMS never matches, and the file is
+    not hashed.
+
+    Args:
+        path: Path to the file to check.
+        expected: Hash string in the format "<algorithm>:<hex_digest>".
 
     Returns:
-        Dict mapping template source paths to project destination paths.
+        True if the file's hash equals the expected hash.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
     """
+    algorithm, _, _ = expected.partition(":")
+    if algorithm not in SUPPORTED_HASH_ALGORITHMS:
+        # Still raise FileNotFoundError for a missing file, like the hashing path
+        path.stat()
+        return False
+    return hash_file(path, algorithm) == expected
+
+
+def _build_tracked_files(framework: str) -> dict[str, str]:
+    """Build the template source -> project destination mapping for a framework."""
     files = dict(TOOL_OWNED_FILES)
     for template_name, dest_path in FRAMEWORK_OWNED_FILES.items():
         files[f"{framework}/{template_name}"] = dest_path
     return files
 
 
-def read_manifest(project_dir: Path) -> dict:
-    """Read [tool.gds-idea-app-kit] from pyproject.toml.
+# The mappings only depend on module constants, so build them once at import.
+_TRACKED_BY_FRAMEWORK: dict[str, dict[str, str]] = {
+    framework: _build_tracked_files(framework) for framework in ("streamlit", "dash", "fastapi")
+}
+
+# The same mappings as (template_src, dest_path) pairs in sorted order, for building manifests.
+_SORTED_TRACKED_BY_FRAMEWORK: dict[str, tuple[tuple[str, str], ...]] = {
+    framework: tuple(sorted(tracked.items()))
+    for framework, tracked in _TRACKED_BY_FRAMEWORK.items()
+}
+
+
+def get_tracked_files(framework: str) -> dict[str, str]:
+    """Get the full mapping of template source -> project destination for a framework.
+
+    Args:
+        framework: The framework name (streamlit, dash, fastapi).
+
+    Returns:
+        Dict mapping template source paths to project destination paths. This is a
+        fresh copy, so callers may modify it.
+    """
+    tracked = _TRACKED_BY_FRAMEWORK.get(framework)
+    if tracked is None:
+        tracked = _build_tracked_files(framework)
+    return dict(tracked)
+
+
+def load_pyproject(project_dir: Path) -> tomlkit.TOMLDocument:
+    """Parse pyproject.toml into a format-preserving tomlkit document.
+
+    Callers that both read and write the manifest can parse once and pass the
+    document to read_manifest() and write_manifest().
 
     Args:
         project_dir: Root directory of the project.
 
     Returns:
-        The manifest dict, or empty dict if the section doesn't exist.
+        The parsed document.
     """
-    pyproject_path = project_dir / "pyproject.toml"
-    if not pyproject_path.exists():
-        return {}
+    with open(project_dir / "pyproject.toml") as f:
+        return tomlkit.load(f)
 
-    with open(pyproject_path) as f:
-        config = tomlkit.load(f)
 
-    return dict(config.get("tool", {}).get(MANIFEST_KEY, {}))
+def read_manifest(project_dir: Path, doc: tomlkit.TOMLDocument | None = None) -> dict:
+    """Read [tool.gds-idea-app-kit] from pyproject.toml.
 
+    Args:
+        project_dir: Root directory of the project.
+        doc: Already-parsed pyproject.toml. If not provided, the file is read with
+            tomllib, which is faster than tomlkit when nothing will be written back.
+
+    Returns:
+        The manifest dict, or empty dict if the file or section doesn't exist.
+    """
+    if doc is None:
+        try:
+            content = (project_dir / "pyproject.toml").read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return {}
+        doc = tomllib.loads(content)
+
+    return dict(doc.get("tool", {}).get(MANIFEST_KEY, {}))
 
-def write_manifest(project_dir: Path, manifest: dict) -> None:
+
+def write_manifest(
+    project_dir: Path,
+    manifest: dict,
+    doc: tomlkit.TOMLDocument | None = None,
+) -> None:
     """Write/update [tool.gds-idea-app-kit] in pyproject.toml, preserving other content.
 
     Args:
         project_dir: Root directory of the project.
         manifest: The manifest dict to write.
+        doc: Already-parsed pyproject.toml to update and write back. If not
+            provided, the file is read first.
     """
     pyproject_path = project_dir / "pyproject.toml"
 
-    with open(pyproject_path) as f:
-        config = tomlkit.load(f)
+    config = doc if doc is not None else load_pyproject(project_dir)
 
     # Ensure [tool] section exists
     if "tool" not in config:
@@ -104,11 +198,21 @@ def write_manifest(project_dir: Path, manifest: dict) -> None:
         tomlkit.dump(config, f)
 
 
+def _list_dir(directory: Path) -> set[str]:
+    """Return the names of the entries in a directory, or an empty set if it is missing."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+
 def build_manifest(
     framework: str,
     app_name: str,
     tool_version: str,
     project_dir: Path,
+    precomputed_hashes: dict[str, str] | None = None,
 ) -> dict:
     """Build a manifest dict by hashing the tracked files in project_dir.
 
@@ -117,17 +221,38 @@ def build_manifest(
         app_name: The application name.
         tool_version: The version of gds-idea-app-kit that generated the project.
         project_dir: Root directory of the project.
+        precomputed_hashes: Optional mapping of destination paths to hashes already
+            known for their current content (e.g. of content just written). These
+            files are not re-read; all other present files are hashed from disk.
 
     Returns:
         Complete manifest dict ready to write to pyproject.toml.
     """
-    tracked = get_tracked_files(framework)
-
-    file_hashes = {}
-    for _template_src, dest_path in sorted(tracked.items()):
-        full_path = project_dir / dest_path
-        if full_path.exists():
-            file_hashes[dest_path] = hash_file(full_path)
+    tracked_items = _SORTED_TRACKED_BY_FRAMEWORK.get(framework)
+    if tracked_items is None:
+        tracked_items = tuple(sorted(get_tracked_files(framework).items()))
+
+    # List each destination directory once rather than stat-ing every tracked file.
+    listings: dict[str, set[str]] = {}
+    present = []
+    for _template_src, dest_path in tracked_items:
+        parent, _, name = dest_path.rpartition("/")
+        if parent not in listings:
+            listings[parent] = _list_dir(project_dir / parent)
+        if name in listings[parent]:
+            present.append(dest_path)
+
+    known = precomputed_hashes or {}
+    to_hash = [p for p in present if p not in known]
+
+    # Hashing releases the GIL, so files can be hashed concurrently.
+    hashed = {}
+    if to_hash:
+        with ThreadPoolExecutor(max_workers=min(8, len(to_hash))) as executor:
+            digests = executor.map(hash_file, (project_dir / p for p in to_hash))
+            hashed = dict(zip(to_hash, digests, strict=True))
+
+    file_hashes = {p: known[p] if p in known else hashed[p] for p in present}
 
     manifest = {
         "framework": framework,
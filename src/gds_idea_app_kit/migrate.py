@@ -20,9 +20,21 @@ import click
 import tomlkit
 
 from gds_idea_app_kit import __version__
-from gds_idea_app_kit.manifest import build_manifest, read_manifest, write_manifest
+from gds_idea_app_kit._pyproject import load_webapp_config
+from gds_idea_app_kit.manifest import (
+    build_manifest,
+    load_pyproject,
+    read_manifest,
+    write_manifest,
+)
 from gds_idea_app_kit.update import run_update
 
+# Dockerfile base image line, e.g. "FROM python:3.13-slim AS base"
+_DOCKER_PY_RE = re.compile(rb"FROM python:(\d+\.\d+)")
+
+# First X.Y in a requires-python specifier, e.g. ">=3.13"
+_REQUIRES_PY_RE = re.compile(r"(\d+\.\d+)")
+
 
 def _detect_python_version(project_dir: Path) -> str:
     """Detect the Python version from project files.
@@ -39,42 +51,40 @@ def _detect_python_version(project_dir: Path) -> str:
     # Try Dockerfile first: FROM python:X.Y-slim
     dockerfile = project_dir / "app_src" / "Dockerfile"
     if dockerfile.exists():
-        match = re.search(r"FROM python:(\d+\.\d+)", dockerfile.read_text())
+        # Scan the raw bytes; the version is ASCII so there is no need to decode
+        match = _DOCKER_PY_RE.search(dockerfile.read_bytes())
         if match:
-            return match.group(1)
+            return match.group(1).decode("ascii")
 
     # Try app_src/pyproject.toml: requires-python = ">=X.Y"
     app_pyproject = project_dir / "app_src" / "pyproject.toml"
     if app_pyproject.exists():
-        with open(app_pyproject, "rb") as f:
-            config = tomllib.load(f)
+        config = tomllib.loads(app_pyproject.read_text(encoding="utf-8"))
         requires = config.get("project", {}).get("requires-python", "")
-        match = re.search(r"(\d+\.\d+)", requires)
+        match = _REQUIRES_PY_RE.search(requires)
         if match:
             return match.group(1)
 
     return "3.13"
 
 
-def _read_webapp_config(project_dir: Path) -> dict[str, str]:
+def _read_webapp_config(
+    project_dir: Path,
+    doc: tomlkit.TOMLDocument | None = None,
+) -> dict[str, str]:
     """Read framework and app_name from [tool.webapp] in pyproject.toml.
 
     Args:
         project_dir: The project root directory.
+        doc: Already-parsed pyproject.toml. If not provided, the file is read.
 
     Returns:
         Dict with "framework" and "app_name".
     """
-    pyproject_path = project_dir / "pyproject.toml"
-
-    if not pyproject_path.exists():
-        click.echo("Error: No pyproject.toml found. Are you in a project root?", err=True)
-        sys.exit(1)
-
-    with open(pyproject_path, "rb") as f:
-        config = tomllib.load(f)
-
-    webapp = config.get("tool", {}).get("webapp", {})
+    if doc is not None:
+        webapp = doc.get("tool", {}).get("webapp", {})
+    else:
+        webapp = load_webapp_config(project_dir)
     framework = webapp.get("framework", "")
     app_name = webapp.get("app_name", "")
 
@@ -86,7 +96,10 @@ def _read_webapp_config(project_dir: Path) -> dict[str, str]:
     return {"framework": framework, "app_name": app_name}
 
 
-def _remove_old_config(project_dir: Path) -> None:
+def _remove_old_config(
+    project_dir: Path,
+    doc: tomlkit.TOMLDocument | None = None,
+) -> tomlkit.TOMLDocument:
     """Remove old template entry points and build config from pyproject.toml.
 
     Removes:
@@ -99,10 +112,14 @@ def _remove_old_config(project_dir: Path) -> None:
 
     Args:
         project_dir: The project root directory.
+        doc: Already-parsed pyproject.toml to modify in place. The caller is then
+            responsible for writing it back. If not provided, the file is read,
+            modified and written back.
+
+    Returns:
+        The modified document.
     """
-    pyproject_path = project_dir / "pyproject.toml"
-    with open(pyproject_path) as f:
-        config = tomlkit.load(f)
+    config = doc if doc is not None else load_pyproject(project_dir)
 
     # Remove [build-system]
     if "build-system" in config:
@@ -119,8 +136,11 @@ def _remove_old_config(project_dir: Path) -> None:
             del uv_config["build-backend"]
         uv_config["package"] = False
 
-    with open(pyproject_path, "w") as f:
-        tomlkit.dump(config, f)
+    if doc is None:
+        with open(project_dir / "pyproject.toml", "w") as f:
+            tomlkit.dump(config, f)
+
+    return config
 
 
 def _remove_template_dir(project_dir: Path) -> None:
@@ -151,13 +171,16 @@ def run_migrate() -> None:
         click.echo("Error: No pyproject.toml found. Are you in a project root?", err=True)
         sys.exit(1)
 
-    manifest = read_manifest(project_dir)
+    # Parse pyproject.toml once; every step below reads from and edits this document.
+    doc = load_pyproject(project_dir)
+
+    manifest = read_manifest(project_dir, doc)
     if manifest:
         click.echo("This project has already been migrated.", err=True)
         click.echo("  Use 'idea-app update' instead.", err=True)
         sys.exit(1)
 
-    webapp_config = _read_webapp_config(project_dir)
+    webapp_config = _read_webapp_config(project_dir, doc)
     framework = webapp_config["framework"]
     app_name = webapp_config["app_name"]
     python_version = _detect_python_version(project_dir)
@@ -190,10 +213,10 @@ def run_migrate() -> None:
         project_dir=project_dir,
     )
     new_manifest["python_version"] = python_version
-    write_manifest(project_dir, new_manifest)
 
     click.echo("Removing old template configuration...")
-    _remove_old_config(project_dir)
+    _remove_old_config(project_dir, doc)
+    write_manifest(project_dir, new_manifest, doc)
 
     template_dir = project_dir / "template"
     if template_dir.is_dir():
@@ -201,9 +224,10 @@ def run_migrate() -> None:
         _remove_template_dir(project_dir)
 
     # Sync the environment so old entry points (smoke_test, configure, etc.)
-    # installed via [project.scripts] are removed.
+    # installed via [project.scripts] are removed. uv's output goes straight to
+    # the terminal so progress is visible and nothing is buffered in memory.
     click.echo("Syncing environment...")
-    subprocess.run(["uv", "sync"], cwd=project_dir, check=True, capture_output=True, text=True)
+    subprocess.run(["uv", "sync"], cwd=project_dir, check=True)
 
     click.echo("Migration complete.")
     click.echo()
@@ -7,6 +7,7 @@ plugin are installed and available before starting work.  Used by both
 
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 import click
 
@@ -25,6 +26,22 @@ PREREQUISITES: list[tuple[str, list[str], str, str | None]] = [
 ]
 
 
+def _is_installed(check_cmd: list[str]) -> bool:
+    """Run a tool's check command and report whether it succeeded.
+
+    Args:
+        check_cmd: The command used to probe for the tool.
+
+    Returns:
+        True if the command ran and exited zero, False otherwise.
+    """
+    try:
+        subprocess.run(check_cmd, capture_output=True, check=True)
+    except (FileNotFoundError, subprocess.CalledProcessError):
+        return False
+    return True
+
+
 def check_prerequisites(only: list[str] | None = None) -> None:
     """Verify that required external tools are installed.
 
@@ -40,23 +57,29 @@ def check_prerequisites(only: list[str] | None = None) -> None:
     if only is not None:
         to_check = [p for p in PREREQUISITES if p[0] in only]
 
-    missing: list[tuple[str, str, str | None]] = []
+    if not to_check:
+        return
+
+    # The probes are independent, so run them concurrently to overlap
+    # process start-up latency.  Results are collected in PREREQUISITES order.
+    with ThreadPoolExecutor(max_workers=len(to_check)) as executor:
+        installed = list(executor.map(_is_installed, (p[1] for p in to_check)))
 
-    for name, check_cmd, install_hint, url in to_check:
-        try:
-            subprocess.run(check_cmd, capture_output=True, check=True)
-        except (FileNotFoundError, subprocess.CalledProcessError):
-            missing.append((name, install_hint, url))
+    missing: list[tuple[str, str, str | None]] = [
+        (name, install_hint, url)
+        for (name, _, install_hint, url), ok in zip(to_check, installed, strict=True)
+        if not ok
+    ]
 
     if not missing:
         return
 
-    click.echo("Error: missing required tools:", err=True)
-    click.echo("", err=True)
+    # Build the whole report first so it reaches stderr in a single write.
+    lines = ["Error: missing required tools:", ""]
     for name, hint, url in missing:
-        click.echo(f"  {name:20s} {hint}", err=True)
+        lines.append(f"  {name:20s} {hint}")
         if url:
-            click.echo(f"  {'':20s} {url}", err=True)
-    click.echo("", err=True)
-    click.echo("Install the missing tools and try again.", err=True)
+            lines.append(f"  {'':20s} {url}")
+    lines += ["", "Install the missing tools and try again."]
+    click.echo("\n".join(lines), err=True)
     sys.exit(1)
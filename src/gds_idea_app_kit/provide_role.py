@@ -18,18 +18,31 @@ Usage:
 
 import os
 import sys
-import tomllib
 from pathlib import Path
 
 import boto3
 import click
+from botocore.client import BaseClient
 from botocore.exceptions import ClientError, NoCredentialsError
 
+from gds_idea_app_kit._pyproject import load_webapp_config
+
 AWS_DEV_DIR = ".aws-dev"
 CREDENTIALS_FILE = "credentials"
 CONFIG_FILE = "config"
 DEFAULT_REGION = "eu-west-2"
 
+CREDENTIALS_TEMPLATE = (
+    "# Auto-generated by idea-app provide-role\n"
+    "# {source_description}\n"
+    "# Expires: {expiration}\n"
+    "[default]\n"
+    "aws_access_key_id = {AccessKeyId}\n"
+    "aws_secret_access_key = {SecretAccessKey}\n"
+    "aws_session_token = {SessionToken}\n"
+)
+CONFIG_TEMPLATE = "[default]\nregion = {region}\noutput = json\n"
+
 
 def _check_aws_profile() -> str:
     """Check that AWS_PROFILE is set and return the profile name.
@@ -57,16 +70,7 @@ def _get_role_config(project_dir: Path) -> dict[str, str]:
     Returns:
         Dict with "role_arn" (empty string if not configured) and "region".
     """
-    pyproject_path = project_dir / "pyproject.toml"
-
-    if not pyproject_path.exists():
-        click.echo("Error: No pyproject.toml found. Are you in a project root?", err=True)
-        sys.exit(1)
-
-    with open(pyproject_path, "rb") as f:
-        config = tomllib.load(f)
-
-    dev_config = config.get("tool", {}).get("webapp", {}).get("dev", {})
+    dev_config = load_webapp_config(project_dir).get("dev", {})
 
     return {
         "role_arn": dev_config.get("aws_role_arn", ""),
@@ -91,17 +95,16 @@ def _select_mode(role_arn: str, use_profile: bool) -> tuple[bool, str]:
     return True, "no aws_role_arn in pyproject.toml"
 
 
-def _get_current_identity(session: boto3.Session) -> dict:
+def _get_current_identity(sts: BaseClient) -> dict:
     """Get current AWS identity to verify credentials are active.
 
     Args:
-        session: A boto3 session.
+        sts: An STS client.
 
     Returns:
         The caller identity response dict.
     """
     try:
-        sts = session.client("sts")
         return sts.get_caller_identity()
     except NoCredentialsError as e:
         raise RuntimeError("No AWS credentials found.") from e
@@ -110,11 +113,11 @@ def _get_current_identity(session: boto3.Session) -> dict:
         raise RuntimeError(f"Failed to verify AWS credentials: {error_msg}") from e
 
 
-def _assume_role(session: boto3.Session, role_arn: str, duration: int) -> dict:
+def _assume_role(sts: BaseClient, role_arn: str, duration: int) -> dict:
     """Assume the specified AWS role from current credentials.
 
     Args:
-        session: A boto3 session.
+        sts: An STS client.
         role_arn: The ARN of the role to assume.
         duration: Session duration in seconds.
 
@@ -122,7 +125,6 @@ def _assume_role(session: boto3.Session, role_arn: str, duration: int) -> dict:
         The STS assume_role response dict.
     """
     try:
-        sts = session.client("sts")
         return sts.assume_role(
             RoleArn=role_arn,
             RoleSessionName="dev-container",
@@ -167,6 +169,30 @@ def _get_session_credentials(session: boto3.Session) -> dict:
         raise RuntimeError(f"Failed to extract session credentials: {e}") from e
 
 
+def _write_private_file(path: Path, content: str) -> None:
+    """Atomically replace a file with content readable only by the current user.
+
+    The content is written to a temporary file created with mode 0o600, then
+    renamed over the target, so the container never sees a half-written file.
+    If anything fails, the temporary file is removed so no copy of the content
+    is left behind.
+
+    Args:
+        path: The file to write.
+        content: The text to write.
+    """
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.unlink(missing_ok=True)
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content.encode())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def _write_credentials(
     project_dir: Path,
     creds: dict,
@@ -188,25 +214,18 @@ def _write_credentials(
     aws_dev_dir = project_dir / AWS_DEV_DIR
     aws_dev_dir.mkdir(exist_ok=True)
 
-    expiration = creds.get("Expiration")
-    if expiration:
-        expiration_line = f"# Expires: {expiration}"
-    else:
-        expiration_line = "# Expires: unknown"
-
-    credentials_content = (
-        f"# Auto-generated by idea-app provide-role\n"
-        f"# {source_description}\n"
-        f"{expiration_line}\n"
-        f"[default]\n"
-        f"aws_access_key_id = {creds['AccessKeyId']}\n"
-        f"aws_secret_access_key = {creds['SecretAccessKey']}\n"
-        f"aws_session_token = {creds['SessionToken']}\n"
+    credentials_content = CREDENTIALS_TEMPLATE.format_map(
+        {
+            **creds,
+            "source_description": source_description,
+            "expiration": _format_expiration(creds),
+        }
     )
+    config_content = CONFIG_TEMPLATE.format(region=region)
 
-    config_content = f"[default]\nregion = {region}\noutput = json\n"
-
-    (aws_dev_dir / CREDENTIALS_FILE).write_text(credentials_content)
+    _write_private_file(aws_dev_dir / CREDENTIALS_FILE, credentials_content)
+    # config holds no secrets, so it keeps normal permissions and stays readable
+    # by the container user even when its UID differs from the host user's.
     (aws_dev_dir / CONFIG_FILE).write_text(config_content)
 
 
@@ -242,9 +261,11 @@ def run_provide_role(use_profile: bool, duration: int) -> None:
     click.echo("Checking AWS credentials...")
     click.echo(f"  AWS_PROFILE: {profile_name}")
 
+    # One session and STS client serve both the identity check and role assumption.
     session = boto3.Session()
     try:
-        identity = _get_current_identity(session)
+        sts = session.client("sts")
+        identity = _get_current_identity(sts)
         current_arn = identity.get("Arn", "")
         click.echo(f"  Current identity: {current_arn}")
     except RuntimeError as e:
@@ -273,7 +294,7 @@ def run_provide_role(use_profile: bool, duration: int) -> None:
     if not use_pass_through:
         click.echo("Assuming role...")
         try:
-            response = _assume_role(session, role_arn, duration)
+            response = _assume_role(sts, role_arn, duration)
             creds = response["Credentials"]
             assumed_arn = response.get("AssumedRoleUser", {}).get("Arn", "")
             source_description = f"Role: {role_arn}"
@@ -10,24 +10,28 @@ Usage:
     idea-app smoke-test --wait       # build, health check, keep running
 """
 
+import functools
 import os
 import subprocess
 import sys
 import time
-import tomllib
 import urllib.error
 import urllib.request
 from pathlib import Path
 
 import click
 
+from gds_idea_app_kit._pyproject import load_webapp_config
 from gds_idea_app_kit.prerequisites import check_prerequisites
 
 COMPOSE_FILE = ".devcontainer/docker-compose.yml"
 SERVICE_NAME = "app"
 CONTAINER_PORT = 8080
 MAX_WAIT_SECONDS = 120
+# Polling starts fast and backs off, so a quick start-up is noticed promptly.
+INITIAL_POLL_INTERVAL_SECONDS = 0.1
 POLL_INTERVAL_SECONDS = 2
+FAILURE_LOG_LINES = 200
 
 HEALTH_PATHS: dict[str, str] = {
     "streamlit": "/_stcore/health",
@@ -45,16 +49,7 @@ def _get_framework(project_dir: Path) -> str:
     Returns:
         The framework name (e.g. "streamlit").
     """
-    pyproject_path = project_dir / "pyproject.toml"
-
-    if not pyproject_path.exists():
-        click.echo("Error: No pyproject.toml found. Are you in a project root?", err=True)
-        sys.exit(1)
-
-    with open(pyproject_path, "rb") as f:
-        config = tomllib.load(f)
-
-    framework = config.get("tool", {}).get("webapp", {}).get("framework", "")
+    framework = load_webapp_config(project_dir).get("framework", "")
 
     if not framework:
         click.echo("Error: No framework configured in [tool.webapp].", err=True)
@@ -76,6 +71,19 @@ def _get_health_path(framework: str) -> str:
     return HEALTH_PATHS.get(framework, "/health")
 
 
+@functools.cache
+def _compose_env() -> dict[str, str]:
+    """Build the environment for docker compose commands, selecting the production target.
+
+    Built once on first use and shared by every _compose call; subprocess copies it
+    into the child process, so it is never modified.
+
+    Returns:
+        A copy of os.environ with DOCKER_TARGET set to "production".
+    """
+    return {**os.environ, "DOCKER_TARGET": "production"}
+
+
 def _compose(
     *args: str,
     stream: bool = False,
@@ -86,6 +94,7 @@ def _compose(
     Args:
         *args: Arguments to pass to docker compose (e.g. "build", "up", "-d").
         stream: If True, inherit stdout/stderr so output streams to terminal.
+            Otherwise output is captured as bytes.
         check: If True, raise CalledProcessError on non-zero exit.
 
     Returns:
@@ -93,13 +102,12 @@ def _compose(
     """
     cmd = ["docker", "compose", "-f", COMPOSE_FILE, *args]
 
-    env = os.environ.copy()
-    env["DOCKER_TARGET"] = "production"
+    env = _compose_env()
 
     if stream:
         return subprocess.run(cmd, check=check, env=env)
     else:
-        return subprocess.run(cmd, check=check, capture_output=True, text=True, env=env)
+        return subprocess.run(cmd, check=check, capture_output=True, env=env)
 
 
 def _get_host_port() -> str:
@@ -110,14 +118,15 @@ def _get_host_port() -> str:
     """
     result = _compose("port", SERVICE_NAME, str(CONTAINER_PORT))
     # Output format: "0.0.0.0:8080" or ":::8080"
-    return result.stdout.strip().split(":")[-1]
+    return result.stdout.decode("ascii").strip().rpartition(":")[2]
 
 
-def _check_health(url: str) -> bool:
+def _check_health(url: str | urllib.request.Request) -> bool:
     """Check if a health endpoint responds with HTTP 200.
 
     Args:
-        url: The full URL to check (e.g. "http://localhost:8080/health").
+        url: The full URL to check (e.g. "http://localhost:8080/health"), or a
+            prepared Request for it.
 
     Returns:
         True if the endpoint responds with 200, False otherwise.
@@ -132,7 +141,8 @@ def _check_health(url: str) -> bool:
 def _poll_health(url: str, timeout: int = MAX_WAIT_SECONDS) -> bool:
     """Poll a health endpoint until it responds or the timeout expires.
 
-    Prints dots while waiting.
+    The interval between checks doubles from INITIAL_POLL_INTERVAL_SECONDS up to
+    POLL_INTERVAL_SECONDS. Prints dots while waiting.
 
     Args:
         url: The health check URL.
@@ -141,24 +151,33 @@ def _poll_health(url: str, timeout: int = MAX_WAIT_SECONDS) -> bool:
     Returns:
         True if the health check passed, False if it timed out.
     """
-    seconds_waited = 0
-    while seconds_waited < timeout:
-        if _check_health(url):
+    # Parse the URL once; the same Request is reused for every check.
+    request = urllib.request.Request(url)
+    deadline = time.monotonic() + timeout
+    interval = INITIAL_POLL_INTERVAL_SECONDS
+    while True:
+        if _check_health(request):
             click.echo()
             return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
         click.echo(".", nl=False)
-        time.sleep(POLL_INTERVAL_SECONDS)
-        seconds_waited += POLL_INTERVAL_SECONDS
+        time.sleep(min(interval, remaining))
+        interval = min(interval * 2, POLL_INTERVAL_SECONDS)
 
     click.echo()
     return False
 
 
 def _show_failure_logs() -> None:
-    """Print container logs to help debug a health check failure."""
+    """Print the tail of the container logs to help debug a health check failure."""
+    click.echo()
+    click.echo(f"Container logs (last {FAILURE_LOG_LINES} lines):")
+    _compose("logs", "--tail", str(FAILURE_LOG_LINES), "--no-color", stream=True, check=False)
     click.echo()
-    click.echo("Container logs:")
-    _compose("logs", stream=True, check=False)
+    click.echo("For the full logs, run:")
+    click.echo(f"  docker compose -f {COMPOSE_FILE} logs")
 
 
 def _cleanup() -> None:
@@ -195,29 +214,37 @@ def run_smoke_test(build_only: bool, wait: bool = False) -> None:
         click.echo("  Run 'idea-app update' to restore missing files.", err=True)
         sys.exit(1)
 
-    # -- Build --
-    click.echo("Building production image...")
+    # -- Build (and start, unless build-only) --
+    # A full run builds and starts in one "up --build" so docker compose only
+    # has to start up once.
+    if build_only:
+        click.echo("Building production image...")
+        compose_args = ("build",)
+    else:
+        click.echo("Building production image and starting container...")
+        compose_args = ("up", "--build", "-d")
     try:
-        _compose("build", stream=True)
+        _compose(*compose_args, stream=True)
     except subprocess.CalledProcessError:
-        click.echo("Error: Docker build failed.", err=True)
+        if build_only:
+            click.echo("Error: Docker build failed.", err=True)
+        else:
+            click.echo("Error: Docker build or container start failed.", err=True)
+            _cleanup()
         sys.exit(1)
     except FileNotFoundError:
         click.echo("Error: docker not found. Is Docker installed and running?", err=True)
         sys.exit(1)
-    click.echo("Build complete.")
 
     if build_only:
+        click.echo("Build complete.")
         return
 
-    # -- Start, health check, teardown --
-    container_started = False
+    click.echo("Container started.")
+
+    # -- Health check, teardown --
     try:
         click.echo()
-        click.echo("Starting container...")
-        _compose("up", "-d")
-        container_started = True
-
         host_port = _get_host_port()
         health_url = f"http://localhost:{host_port}{health_path}"
         click.echo(f"  Health check URL: {health_url}")
@@ -243,5 +270,4 @@ def run_smoke_test(build_only: bool, wait: bool = False) -> None:
             input()
 
     finally:
-        if container_started:
-            _cleanup()
+        _cleanup()
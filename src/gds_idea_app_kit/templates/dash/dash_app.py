@@ -10,12 +10,9 @@ logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 
-# Quiet noisy third-party loggers
-logging.getLogger("watchdog").setLevel(logging.WARNING)
-logging.getLogger("urllib3").setLevel(logging.WARNING)
-logging.getLogger("botocore").setLevel(logging.WARNING)
-logging.getLogger("boto3").setLevel(logging.WARNING)
-logging.getLogger("werkzeug").setLevel(logging.WARNING)  # Flask logger
+# Quiet noisy third-party loggers (werkzeug is Flask's logger)
+for _logger_name in ("watchdog", "urllib3", "botocore", "boto3", "werkzeug"):
+    logging.getLogger(_logger_name).setLevel(logging.WARNING)
 
 # Your app logger
 logger = logging.getLogger(__name__)
@@ -3,16 +3,22 @@ import logging
 import streamlit as st
 from cognito_auth.streamlit import StreamlitAuth
 
-# Configure logging - quiet noisy libraries
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
-
-# Quiet noisy third-party loggers
-logging.getLogger("watchdog").setLevel(logging.WARNING)
-logging.getLogger("urllib3").setLevel(logging.WARNING)
-logging.getLogger("botocore").setLevel(logging.WARNING)
-logging.getLogger("boto3").setLevel(logging.WARNING)
+
+# Configure logging - quiet noisy libraries.
+# Streamlit re-runs this script on every interaction; cache_resource makes the
+# setup run once per server process instead.
+@st.cache_resource
+def configure_logging():
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+
+    # Quiet noisy third-party loggers
+    for name in ("watchdog", "urllib3", "botocore", "boto3"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+
+configure_logging()
 
 # Your app logger
 logger = logging.getLogger(__name__)
@@ -14,18 +14,22 @@ The update is structured as plan -> apply -> report:
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 
 import click
+import tomlkit
 
 from gds_idea_app_kit import __version__
 from gds_idea_app_kit.init import _apply_template_vars, _get_templates_dir
 from gds_idea_app_kit.manifest import (
     build_manifest,
     get_tracked_files,
-    hash_file,
+    hash_bytes,
+    hash_matches,
+    load_pyproject,
     read_manifest,
     write_manifest,
 )
@@ -37,23 +41,23 @@ class Action(Enum):
     CREATE = "create"  # file missing from project
     UPDATE = "update"  # file unchanged from manifest, overwrite with latest
     SKIP = "skip"  # locally modified, write .new alongside
-    FORCE = "force"  # locally modified, overwrite anyway (--force)
+    FORCE = "force"  # tracked file overwritten without checking for changes (--force)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FileUpdate:
     """A planned update action for a single tracked file.
 
     Attributes:
         dest_path: Relative path in the project (e.g. "app_src/Dockerfile").
         dest_full: Absolute path to the file.
-        new_content: Rendered template content to write.
+        new_content: Rendered template content to write, as bytes.
         action: What to do with this file.
     """
 
     dest_path: str
     dest_full: Path
-    new_content: str
+    new_content: bytes
     action: Action
 
 
@@ -93,18 +97,22 @@ def _check_version(manifest: dict) -> None:
         pass
 
 
-def _render_template(template_path: Path, template_vars: dict[str, str]) -> str:
+def _render_template(template_path: Path, template_vars: dict[str, str]) -> bytes:
     """Read a template file and apply variable substitution.
 
+    Templates without placeholders are returned as read, without decoding.
+
     Args:
         template_path: Path to the template file.
         template_vars: Mapping of placeholder names to values.
 
     Returns:
-        The rendered template content.
+        The rendered template content as bytes.
     """
-    content = template_path.read_text()
-    return _apply_template_vars(content, template_vars)
+    content = template_path.read_bytes()
+    if b"{{" not in content:
+        return content
+    return _apply_template_vars(content.decode(), template_vars).encode()
 
 
 def _classify_file(
@@ -124,17 +132,61 @@ def _classify_file(
     Returns:
         The Action to take for this file.
     """
-    if not dest_full.exists():
-        return Action.CREATE
-
-    current_hash = hash_file(dest_full)
     manifest_hash = manifest_hashes.get(dest_path)
-    is_modified = manifest_hash is not None and current_hash != manifest_hash
+    if manifest_hash is None:
+        return Action.UPDATE if dest_full.exists() else Action.CREATE
+
+    # --force overwrites tracked files whether or not they were modified, so
+    # there is no need to hash them.
+    if force:
+        return Action.FORCE if dest_full.exists() else Action.CREATE
+
+    # Hashing opens the file anyway, so let that detect a missing file.
+    try:
+        is_modified = not hash_matches(dest_full, manifest_hash)
+    except FileNotFoundError:
+        return Action.CREATE
 
     if not is_modified:
         return Action.UPDATE
 
-    return Action.FORCE if force else Action.SKIP
+    return Action.SKIP
+
+
+def _plan_file(
+    project_dir: Path,
+    template_src: str,
+    dest_path: str,
+    templates_dir: Path,
+    template_vars: dict[str, str],
+    manifest_hashes: dict[str, str],
+    force: bool,
+) -> FileUpdate | None:
+    """Plan the update for a single tracked file.
+
+    Args:
+        project_dir: The project root directory.
+        template_src: Template source path, relative to templates_dir.
+        dest_path: Destination path, relative to project_dir.
+        templates_dir: Root directory containing template files.
+        template_vars: Template variable substitutions.
+        manifest_hashes: Current manifest file hashes.
+        force: Whether --force was specified.
+
+    Returns:
+        The FileUpdate for this file, or None if its template doesn't exist.
+    """
+    template_full = templates_dir / template_src
+
+    try:
+        new_content = _render_template(template_full, template_vars)
+    except FileNotFoundError:
+        return None
+
+    dest_full = project_dir / dest_path
+    action = _classify_file(dest_full, manifest_hashes, dest_path, force)
+
+    return FileUpdate(dest_path, dest_full, new_content, action)
 
 
 def _plan_updates(
@@ -158,22 +210,31 @@ def _plan_updates(
         force: Whether --force was specified.
 
     Returns:
-        List of FileUpdate objects describing what to do with each file.
+        List of FileUpdate objects describing what to do with each file,
+        sorted by template source path.
     """
-    plan = []
-    for template_src, dest_path in sorted(tracked.items()):
-        template_full = templates_dir / template_src
-
-        if not template_full.exists():
-            continue
-
-        new_content = _render_template(template_full, template_vars)
-        dest_full = project_dir / dest_path
-        action = _classify_file(dest_full, manifest_hashes, dest_path, force)
-
-        plan.append(FileUpdate(dest_path, dest_full, new_content, action))
-
-    return plan
+    items = sorted(tracked.items())
+    if not items:
+        return []
+
+    # Each file's template read and hash are independent, so overlap the I/O.
+    # Results are collected in submission order, keeping the plan sorted.
+    with ThreadPoolExecutor(max_workers=min(8, len(items))) as executor:
+        futures = [
+            executor.submit(
+                _plan_file,
+                project_dir,
+                template_src,
+                dest_path,
+                templates_dir,
+                template_vars,
+                manifest_hashes,
+                force,
+            )
+            for template_src, dest_path in items
+        ]
+    plan = [future.result() for future in futures]
+    return [item for item in plan if item is not None]
 
 
 def _apply_updates(plan: list[FileUpdate]) -> None:
@@ -185,13 +246,17 @@ def _apply_updates(plan: list[FileUpdate]) -> None:
     Args:
         plan: List of FileUpdate objects from _plan_updates().
     """
+    # Many files share a directory, so create each destination directory once.
+    parents = {item.dest_full.parent for item in plan if item.action is not Action.SKIP}
+    for parent in parents:
+        parent.mkdir(parents=True, exist_ok=True)
+
     for item in plan:
-        if item.action == Action.SKIP:
+        if item.action is Action.SKIP:
             new_path = Path(f"{item.dest_full}.new")
-            new_path.write_text(item.new_content)
+            new_path.write_bytes(item.new_content)
         else:
-            item.dest_full.parent.mkdir(parents=True, exist_ok=True)
-            item.dest_full.write_text(item.new_content)
+            item.dest_full.write_bytes(item.new_content)
 
 
 def _report_updates(plan: list[FileUpdate], dry_run: bool) -> None:
@@ -201,37 +266,46 @@ def _report_updates(plan: list[FileUpdate], dry_run: bool) -> None:
         plan: List of FileUpdate objects from _plan_updates().
         dry_run: Whether this was a dry run.
     """
-    created = [item for item in plan if item.action == Action.CREATE]
-    updated = [item for item in plan if item.action in (Action.UPDATE, Action.FORCE)]
-    skipped = [item for item in plan if item.action == Action.SKIP]
-
-    for item in created:
-        click.echo(f"  Created: {item.dest_path}")
+    created: list[FileUpdate] = []
+    updated: list[FileUpdate] = []
+    skipped: list[FileUpdate] = []
+    for item in plan:
+        if item.action is Action.CREATE:
+            created.append(item)
+        elif item.action is Action.SKIP:
+            skipped.append(item)
+        else:
+            # UPDATE and FORCE both overwrite the file
+            updated.append(item)
 
-    for item in updated:
-        click.echo(f"  Updated: {item.dest_path}")
+    # Build the whole report first so it reaches stdout in a single write.
+    lines = [f"  Created: {item.dest_path}" for item in created]
+    lines += [f"  Updated: {item.dest_path}" for item in updated]
 
     if skipped:
-        click.echo()
+        lines.append("")
         for item in skipped:
-            click.echo(f"  Skipped: {item.dest_path} (locally modified)")
-            click.echo(f"    New version written to: {item.dest_path}.new")
-            click.echo(f"    Review changes: diff {item.dest_path} {item.dest_path}.new")
+            lines += [
+                f"  Skipped: {item.dest_path} (locally modified)",
+                f"    New version written to: {item.dest_path}.new",
+                f"    Review changes: diff {item.dest_path} {item.dest_path}.new",
+            ]
 
     if not created and not updated and not skipped:
-        click.echo("  Nothing to update.")
+        lines.append("  Nothing to update.")
 
     if skipped and not dry_run:
-        click.echo()
         count = len(skipped)
-        click.echo(
-            f"{count} file(s) were locally modified and skipped. Review the .new files above,"
-        )
-        click.echo("then rename or delete them when done.")
+        lines += [
+            "",
+            f"{count} file(s) were locally modified and skipped. Review the .new files above,",
+            "then rename or delete them when done.",
+        ]
 
     if dry_run:
-        click.echo()
-        click.echo("No changes made (dry run).")
+        lines += ["", "No changes made (dry run)."]
+
+    click.echo("\n".join(lines))
 
 
 def _update_manifest(
@@ -239,6 +313,8 @@ def _update_manifest(
     framework: str,
     app_name: str,
     python_version: str,
+    doc: tomlkit.TOMLDocument | None = None,
+    plan: list[FileUpdate] | None = None,
 ) -> None:
     """Rebuild and write the manifest after applying updates.
 
@@ -247,17 +323,27 @@ def _update_manifest(
         framework: The framework name (e.g. "streamlit").
         app_name: The application name.
         python_version: The Python version string.
+        doc: The pyproject.toml document parsed at the start of the update,
+            reused to avoid parsing the file a second time.
+        plan: The applied update plan. Files it wrote are hashed from their
+            in-memory content instead of being read back from disk.
     """
     click.echo()
     click.echo("Updating manifest...")
+    written_hashes = {
+        item.dest_path: hash_bytes(item.new_content)
+        for item in plan or []
+        if item.action is not Action.SKIP
+    }
     new_manifest = build_manifest(
         framework=framework,
         app_name=app_name,
         tool_version=__version__,
         project_dir=project_dir,
+        precomputed_hashes=written_hashes,
     )
     new_manifest["python_version"] = python_version
-    write_manifest(project_dir, new_manifest)
+    write_manifest(project_dir, new_manifest, doc)
 
 
 def run_update(dry_run: bool, force: bool = False) -> None:
@@ -278,7 +364,9 @@ def run_update(dry_run: bool, force: bool = False) -> None:
         sys.exit(1)
 
     # -- Read manifest --
-    manifest = read_manifest(project_dir)
+    # update never edits pyproject.toml itself, so this parse is reused for the write.
+    doc = load_pyproject(project_dir)
+    manifest = read_manifest(project_dir, doc)
     if not manifest:
         click.echo(
             "Error: No [tool.gds-idea-app-kit] section found in pyproject.toml.",
@@ -325,6 +413,6 @@ def run_update(dry_run: bool, force: bool = False) -> None:
 
     _report_updates(plan, dry_run)
 
-    has_writes = any(item.action in (Action.CREATE, Action.UPDATE, Action.FORCE) for item in plan)
+    has_writes = any(item.action is not Action.SKIP for item in plan)
     if not dry_run and has_writes:
-        _update_manifest(project_dir, framework, app_name, python_version)
+        _update_manifest(project_dir, framework, app_name, python_version, doc, plan)
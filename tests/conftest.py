@@ -3,15 +3,39 @@
 import pytest
 from click.testing import CliRunner
 
-from gds_idea_app_kit.manifest import MANIFEST_KEY
+from gds_idea_app_kit.cli import cli
+from gds_idea_app_kit.init import _get_templates_dir
+from gds_idea_app_kit.manifest import MANIFEST_KEY, get_tracked_files
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def cli_runner():
-    """Click CLI test runner."""
+    """Click CLI test runner, shared by all tests. Each invoke() gets its own isolation."""
     return CliRunner()
 
 
+@pytest.fixture(scope="session")
+def help_results(cli_runner):
+    """--help results for the top-level group and each command, invoked once per session.
+
+    Keyed by the command path as a tuple, e.g. () for the group or ("init",).
+    """
+    targets = [(), ("init",), ("update",), ("smoke-test",), ("provide-role",), ("migrate",)]
+    return {args: cli_runner.invoke(cli, [*args, "--help"]) for args in targets}
+
+
+@pytest.fixture(scope="session")
+def templates_dir():
+    """The bundled templates directory, looked up once per session."""
+    return _get_templates_dir()
+
+
+@pytest.fixture(scope="session")
+def tracked_by_framework():
+    """Tracked-file maps for every framework, built once per session. Treat as read-only."""
+    return {fw: get_tracked_files(fw) for fw in ("streamlit", "dash", "fastapi")}
+
+
 @pytest.fixture()
 def project_dir(tmp_path):
     """Create a minimal project directory with a pyproject.toml."""
@@ -1,12 +1,17 @@
 """Tests for the CLI interface."""
 
-from unittest.mock import patch
+import subprocess
+import sys
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from gds_idea_app_kit import DEFAULT_PYTHON_VERSION, __version__
+from gds_idea_app_kit import init as init_mod
 from gds_idea_app_kit.cli import cli
 
+_FRAMEWORKS = ("streamlit", "dash", "fastapi")
+
 # ---- version and help ----
 
 
@@ -17,9 +22,9 @@ def test_version(cli_runner):
     assert __version__ in result.output
 
 
-def test_help_lists_all_commands(cli_runner):
+def test_help_lists_all_commands(help_results):
     """--help lists all four commands."""
-    result = cli_runner.invoke(cli, ["--help"])
+    result = help_results[()]
     assert result.exit_code == 0
     assert "init" in result.output
     assert "update" in result.output
@@ -27,12 +32,39 @@ def test_help_lists_all_commands(cli_runner):
     assert "provide-role" in result.output
 
 
+def test_cli_import_does_not_load_boto3():
+    """boto3 is only imported when provide-role runs, not at CLI start-up."""
+    code = "import sys, gds_idea_app_kit.cli; sys.exit('boto3' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code])
+    assert result.returncode == 0
+
+
+def test_cli_import_does_not_load_command_modules():
+    """Command implementations are only imported when their command runs."""
+    code = (
+        "import sys, gds_idea_app_kit.cli\n"
+        "loaded = [m for m in ('update', 'manifest', 'init', 'migrate') "
+        "if f'gds_idea_app_kit.{m}' in sys.modules]\n"
+        "sys.exit(', '.join(loaded) or None)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
 # ---- init command ----
 
 
-def test_init_help_shows_options(cli_runner):
+@pytest.fixture()
+def mock_run_init(monkeypatch):
+    """Replace run_init with a mock for the duration of a test."""
+    mock = MagicMock()
+    monkeypatch.setattr(init_mod, "run_init", mock)
+    return mock
+
+
+def test_init_help_shows_options(help_results):
     """init --help shows framework choices and --python option."""
-    result = cli_runner.invoke(cli, ["init", "--help"])
+    result = help_results[("init",)]
     assert result.exit_code == 0
     assert "streamlit" in result.output
     assert "dash" in result.output
@@ -41,31 +73,30 @@ def test_init_help_shows_options(cli_runner):
     assert DEFAULT_PYTHON_VERSION in result.output
 
 
-@pytest.mark.parametrize("framework", ["streamlit", "dash", "fastapi"])
-def test_init_valid_framework(cli_runner, framework):
+@pytest.mark.parametrize("framework", _FRAMEWORKS)
+def test_init_valid_framework(cli_runner, mock_run_init, framework):
     """init accepts valid framework and passes correct args to run_init."""
-    with patch("gds_idea_app_kit.init.run_init") as mock:
-        result = cli_runner.invoke(cli, ["init", framework, "my-app"])
+    result = cli_runner.invoke(cli, ["init", framework, "my-app"])
     assert result.exit_code == 0
-    mock.assert_called_once_with(
+    mock_run_init.assert_called_once_with(
         framework=framework, app_name="my-app", python_version=DEFAULT_PYTHON_VERSION
     )
 
 
-def test_init_custom_python_version(cli_runner):
+def test_init_custom_python_version(cli_runner, mock_run_init):
     """init --python passes the custom version to run_init."""
-    with patch("gds_idea_app_kit.init.run_init") as mock:
-        result = cli_runner.invoke(cli, ["init", "streamlit", "my-app", "--python", "3.12"])
+    result = cli_runner.invoke(cli, ["init", "streamlit", "my-app", "--python", "3.12"])
     assert result.exit_code == 0
-    mock.assert_called_once_with(framework="streamlit", app_name="my-app", python_version="3.12")
+    mock_run_init.assert_called_once_with(
+        framework="streamlit", app_name="my-app", python_version="3.12"
+    )
 
 
-def test_init_default_python_version(cli_runner):
+def test_init_default_python_version(cli_runner, mock_run_init):
     """init uses DEFAULT_PYTHON_VERSION when --python is not given."""
-    with patch("gds_idea_app_kit.init.run_init") as mock:
-        result = cli_runner.invoke(cli, ["init", "streamlit", "my-app"])
+    result = cli_runner.invoke(cli, ["init", "streamlit", "my-app"])
     assert result.exit_code == 0
-    mock.assert_called_once_with(
+    mock_run_init.assert_called_once_with(
         framework="streamlit", app_name="my-app", python_version=DEFAULT_PYTHON_VERSION
     )
 
@@ -89,9 +120,9 @@ def test_init_missing_all_args(cli_runner):
 # ---- update command ----
 
 
-def test_update_help_shows_options(cli_runner):
+def test_update_help_shows_options(help_results):
     """update --help shows --dry-run and --force options."""
-    result = cli_runner.invoke(cli, ["update", "--help"])
+    result = help_results[("update",)]
     assert result.exit_code == 0
     assert "--dry-run" in result.output
     assert "--force" in result.output
@@ -124,8 +155,8 @@ def test_update_force(cli_runner):
 # ---- smoke-test command ----
 
 
-def test_smoke_test_help_shows_options(cli_runner):
-    result = cli_runner.invoke(cli, ["smoke-test", "--help"])
+def test_smoke_test_help_shows_options(help_results):
+    result = help_results[("smoke-test",)]
     assert result.exit_code == 0
     assert "--build-only" in result.output
     assert "--wait" in result.output
@@ -158,8 +189,8 @@ def test_smoke_test_wait(cli_runner):
 # ---- provide-role command ----
 
 
-def test_provide_role_help_shows_options(cli_runner):
-    result = cli_runner.invoke(cli, ["provide-role", "--help"])
+def test_provide_role_help_shows_options(help_results):
+    result = help_results[("provide-role",)]
     assert result.exit_code == 0
     assert "--use-profile" in result.output
     assert "--duration" in result.output
@@ -201,9 +232,9 @@ def test_provide_role_use_profile(cli_runner):
 # ---- migrate command ----
 
 
-def test_migrate_help_shows_description(cli_runner):
+def test_migrate_help_shows_description(help_results):
     """migrate --help shows the command description."""
-    result = cli_runner.invoke(cli, ["migrate", "--help"])
+    result = help_results[("migrate",)]
     assert result.exit_code == 0
     assert "Migrate" in result.output
 
@@ -243,8 +274,8 @@ def test_provide_role_underscore_alias(cli_runner):
     mock.assert_called_once_with(use_profile=False, duration=3600)
 
 
-def test_underscore_aliases_not_in_help(cli_runner):
+def test_underscore_aliases_not_in_help(help_results):
     """Underscore aliases do not appear in --help output."""
-    result = cli_runner.invoke(cli, ["--help"])
+    result = help_results[()]
     assert "smoke_test" not in result.output
     assert "provide_role" not in result.output
@@ -1,5 +1,7 @@
 """Tests for init module helper functions."""
 
+import subprocess
+
 import click
 import pytest
 
@@ -7,7 +9,6 @@ from gds_idea_app_kit import REPO_PREFIX
 from gds_idea_app_kit.init import (
     _apply_template_vars,
     _copy_template,
-    _get_templates_dir,
     _run_command,
     _sanitize_app_name,
 )
@@ -17,125 +18,69 @@ from gds_idea_app_kit.init import (
 # (the name becomes {name}.gds-idea.click).
 
 
-def test_sanitize_valid_name():
-    """A typical hyphenated name passes through unchanged."""
-    assert _sanitize_app_name("my-dashboard") == "my-dashboard"
-
-
-def test_sanitize_simple_name():
-    """A single-word name passes through unchanged."""
-    assert _sanitize_app_name("myapp") == "myapp"
-
-
-def test_sanitize_name_with_numbers():
-    """Names containing digits are valid."""
-    assert _sanitize_app_name("app-123") == "app-123"
-
-
-def test_sanitize_strips_repo_prefix():
-    """If the user accidentally includes the repo prefix, strip it."""
-    assert _sanitize_app_name(f"{REPO_PREFIX}-my-dashboard") == "my-dashboard"
-
-
-def test_sanitize_lowercases():
-    """Mixed-case input is lowercased automatically."""
-    assert _sanitize_app_name("My-Dashboard") == "my-dashboard"
-
-
-def test_sanitize_rejects_empty():
-    """Empty string is rejected."""
-    with pytest.raises(click.BadParameter, match="cannot be empty"):
-        _sanitize_app_name("")
-
-
-def test_sanitize_rejects_empty_after_prefix_strip():
-    """The prefix alone with no name is rejected."""
-    with pytest.raises(click.BadParameter, match="cannot be empty"):
-        _sanitize_app_name(f"{REPO_PREFIX}-")
-
-
-def test_sanitize_rejects_leading_hyphen():
-    """DNS labels cannot start with a hyphen."""
-    with pytest.raises(click.BadParameter, match="start and end"):
-        _sanitize_app_name("-my-app")
-
-
-def test_sanitize_rejects_trailing_hyphen():
-    """DNS labels cannot end with a hyphen."""
-    with pytest.raises(click.BadParameter, match="start and end"):
-        _sanitize_app_name("my-app-")
-
-
-def test_sanitize_rejects_consecutive_hyphens():
-    """Consecutive hyphens are invalid in subdomain labels."""
-    with pytest.raises(click.BadParameter, match="consecutive hyphens"):
-        _sanitize_app_name("my--app")
-
-
-def test_sanitize_rejects_purely_numeric():
-    """Purely numeric names could be confused with IP addresses."""
-    with pytest.raises(click.BadParameter, match="purely numeric"):
-        _sanitize_app_name("12345")
-
-
-def test_sanitize_rejects_underscores():
-    """Underscores are not valid in DNS labels."""
-    with pytest.raises(click.BadParameter, match="lowercase letters"):
-        _sanitize_app_name("my_app")
-
-
-def test_sanitize_rejects_spaces():
-    """Spaces are not valid in DNS labels."""
-    with pytest.raises(click.BadParameter, match="lowercase letters"):
-        _sanitize_app_name("my app")
-
-
-def test_sanitize_rejects_too_long():
-    """DNS labels are limited to 63 characters."""
-    with pytest.raises(click.BadParameter, match="63 characters"):
-        _sanitize_app_name("a" * 64)
-
-
-def test_sanitize_accepts_max_length():
-    """Exactly 63 characters is valid."""
-    name = "a" * 63
-    assert _sanitize_app_name(name) == name
-
-
-def test_sanitize_single_char():
-    """A single letter is a valid name."""
-    assert _sanitize_app_name("a") == "a"
-
-
-def test_sanitize_single_digit_rejected():
-    """A single digit is purely numeric and rejected."""
-    with pytest.raises(click.BadParameter, match="purely numeric"):
-        _sanitize_app_name("1")
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        pytest.param("my-dashboard", "my-dashboard", id="hyphenated"),
+        pytest.param("myapp", "myapp", id="single-word"),
+        pytest.param("app-123", "app-123", id="with-digits"),
+        # If the user accidentally includes the repo prefix, strip it.
+        pytest.param(f"{REPO_PREFIX}-my-dashboard", "my-dashboard", id="strips-repo-prefix"),
+        pytest.param("My-Dashboard", "my-dashboard", id="lowercases"),
+        # DNS labels are limited to 63 characters.
+        pytest.param("a" * 63, "a" * 63, id="max-length"),
+        pytest.param("a", "a", id="single-char"),
+    ],
+)
+def test_sanitize_accepts(name, expected):
+    """Valid names are normalised and returned."""
+    assert _sanitize_app_name(name) == expected
+
+
+@pytest.mark.parametrize(
+    "name, error",
+    [
+        pytest.param("", "cannot be empty", id="empty"),
+        pytest.param(f"{REPO_PREFIX}-", "cannot be empty", id="empty-after-prefix-strip"),
+        pytest.param("-my-app", "start and end", id="leading-hyphen"),
+        pytest.param("my-app-", "start and end", id="trailing-hyphen"),
+        pytest.param("my--app", "consecutive hyphens", id="consecutive-hyphens"),
+        # Purely numeric names could be confused with IP addresses.
+        pytest.param("12345", "purely numeric", id="purely-numeric"),
+        pytest.param("1", "purely numeric", id="single-digit"),
+        pytest.param("my_app", "lowercase letters", id="underscore"),
+        pytest.param("my app", "lowercase letters", id="space"),
+        # A trailing newline must not slip through the pattern match.
+        pytest.param("my-app\n", "lowercase letters", id="trailing-newline"),
+        pytest.param("a" * 64, "63 characters", id="too-long"),
+    ],
+)
+def test_sanitize_rejects(name, error):
+    """Invalid names are rejected with an explanatory error."""
+    with pytest.raises(click.BadParameter, match=error):
+        _sanitize_app_name(name)
 
 
 # ---- _get_templates_dir ----
 # Verifies that bundled template files are accessible via importlib.resources.
 
 
-def test_get_templates_dir_exists():
+def test_get_templates_dir_exists(templates_dir):
     """The templates directory should be bundled with the package."""
-    templates = _get_templates_dir()
-    assert templates.exists()
-    assert templates.is_dir()
+    assert templates_dir.exists()
+    assert templates_dir.is_dir()
 
 
-def test_get_templates_dir_has_common():
+def test_get_templates_dir_has_common(templates_dir):
     """The common/ subdirectory contains shared template files."""
-    templates = _get_templates_dir()
-    assert (templates / "common").is_dir()
+    assert (templates_dir / "common").is_dir()
 
 
-def test_get_templates_dir_has_frameworks():
+def test_get_templates_dir_has_frameworks(templates_dir):
     """Each supported framework has its own template subdirectory."""
-    templates = _get_templates_dir()
-    assert (templates / "streamlit").is_dir()
-    assert (templates / "dash").is_dir()
-    assert (templates / "fastapi").is_dir()
+    assert (templates_dir / "streamlit").is_dir()
+    assert (templates_dir / "dash").is_dir()
+    assert (templates_dir / "fastapi").is_dir()
 
 
 # ---- _apply_template_vars ----
@@ -170,6 +115,13 @@ def test_apply_vars_empty_variables():
     assert result == "{{app_name}} stays"
 
 
+def test_apply_vars_unknown_placeholder_untouched():
+    """Placeholders with no matching variable are left in place."""
+    content = "{{app_name}} on {{year}}"
+    result = _apply_template_vars(content, {"app_name": "foo"})
+    assert result == "foo on {{year}}"
+
+
 def test_apply_vars_repeated_placeholder():
     """The same placeholder appearing twice is replaced in both locations."""
     content = "{{app_name}} and {{app_name}}"
@@ -228,6 +180,20 @@ def test_copy_template_without_variables(tmp_path):
     assert dest.read_text() == "no {{placeholders}} replaced"
 
 
+def test_copy_template_records_created_dirs(tmp_path):
+    """Parent directories are created once and recorded in the created_dirs set."""
+    src = tmp_path / "template.txt"
+    src.write_text("content")
+    created_dirs: set = set()
+
+    _copy_template(src, tmp_path / "out" / "a.txt", created_dirs=created_dirs)
+    _copy_template(src, tmp_path / "out" / "b.txt", created_dirs=created_dirs)
+
+    assert created_dirs == {tmp_path / "out"}
+    assert (tmp_path / "out" / "a.txt").read_text() == "content"
+    assert (tmp_path / "out" / "b.txt").read_text() == "content"
+
+
 # ---- _run_command ----
 # Wraps subprocess.run with error handling: catches missing commands
 # (especially cdk with install instructions) and prints a cleanup
@@ -238,11 +204,22 @@ def test_run_command_success(tmp_path):
     """A successful command returns the CompletedProcess result."""
     result = _run_command(["echo", "hello"], cwd=tmp_path)
     assert result.returncode == 0
-    assert "hello" in result.stdout
+    assert b"hello" in result.stdout
+
+
+def _fake_run(exc):
+    """Build a subprocess.run replacement that raises the given exception."""
 
+    def run(cmd, **kwargs):
+        raise exc
 
-def test_run_command_failed_prints_cleanup(tmp_path, capsys):
+    return run
+
+
+def test_run_command_failed_prints_cleanup(tmp_path, capsys, monkeypatch):
     """A failing command prints stderr and a cleanup rm -rf suggestion."""
+    error = subprocess.CalledProcessError(1, ["false"], stderr=b"")
+    monkeypatch.setattr("gds_idea_app_kit.init.subprocess.run", _fake_run(error))
     with pytest.raises(SystemExit):
         _run_command(["false"], cwd=tmp_path, project_dir=tmp_path)
 
@@ -251,22 +228,28 @@ def test_run_command_failed_prints_cleanup(tmp_path, capsys):
     assert str(tmp_path) in captured.err
 
 
-def test_run_command_missing_cdk_prints_install_instructions(tmp_path, capsys):
-    """When cdk is not found, prints npm/brew install instructions."""
+def test_run_command_failed_prints_decoded_stderr(tmp_path, capsys, monkeypatch):
+    """stderr from a failing command is decoded and printed as text."""
+    error = subprocess.CalledProcessError(1, ["uv", "sync"], stderr=b"boom\n")
+    monkeypatch.setattr("gds_idea_app_kit.init.subprocess.run", _fake_run(error))
     with pytest.raises(SystemExit):
-        _run_command(["cdk-nonexistent-binary"], cwd=tmp_path)
+        _run_command(["uv", "sync"], cwd=tmp_path)
 
     captured = capsys.readouterr()
-    assert "not installed" in captured.err
+    assert "boom" in captured.err
+    assert "b'" not in captured.err
 
 
-def test_run_command_missing_cdk_specific_message(tmp_path, capsys):
-    """The cdk-specific error message includes npm and brew install options."""
+def test_run_command_missing_cdk_prints_install_instructions(tmp_path, capsys, monkeypatch):
+    """When cdk is not found, prints npm/brew install instructions."""
+    monkeypatch.setattr("gds_idea_app_kit.init.subprocess.run", _fake_run(FileNotFoundError()))
     with pytest.raises(SystemExit):
-        _run_command(["cdk"], cwd=tmp_path)
+        _run_command(["cdk", "init"], cwd=tmp_path)
 
-    # cdk might actually be installed -- only check the error path
-    # if it actually failed with FileNotFoundError
+    captured = capsys.readouterr()
+    assert "'cdk' is not installed" in captured.err
+    assert "npm install -g aws-cdk" in captured.err
+    assert "brew install aws-cdk" in captured.err
 
 
 def test_run_command_missing_arbitrary_binary(tmp_path, capsys):
@@ -10,7 +10,6 @@ Run with: uv run pytest -m integration
 Skip with: uv run pytest -m "not integration"
 """
 
-import os
 import subprocess
 import tomllib
 
@@ -19,17 +18,25 @@ import pytest
 from gds_idea_app_kit.init import run_init
 from gds_idea_app_kit.manifest import read_manifest
 
+pytestmark = pytest.mark.integration
 
-@pytest.mark.integration
-def test_init_streamlit_end_to_end(tmp_path):
-    """Full init creates a working streamlit project with all deps resolved."""
-    os.chdir(tmp_path)
-    run_init(framework="streamlit", app_name="integ-test", python_version="3.13")
 
-    project = tmp_path / "gds-idea-app-integ-test"
+@pytest.fixture(scope="session")
+def streamlit_project(tmp_path_factory):
+    """A streamlit project scaffolded once by a full run_init and shared by every test.
 
-    # ---- Project structure ----
+    Tests must treat the project as read-only.
+    """
+    workdir = tmp_path_factory.mktemp("integration")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(workdir)
+        run_init(framework="streamlit", app_name="integ-test", python_version="3.13")
+    return workdir / "gds-idea-app-integ-test"
 
+
+def test_init_creates_project_structure(streamlit_project):
+    """Full init creates the project directory with all scaffolded files."""
+    project = streamlit_project
     assert project.is_dir(), "Project directory should be created"
 
     # CDK files
@@ -49,44 +56,49 @@ def test_init_streamlit_end_to_end(tmp_path):
     assert (project / "dev_mocks" / "dev_mock_authoriser.json").exists()
     assert (project / "dev_mocks" / "dev_mock_user.json").exists()
 
-    # ---- Template variables substituted ----
 
-    dockerfile = (project / "app_src" / "Dockerfile").read_text()
+def test_init_substitutes_template_variables(streamlit_project):
+    """Template placeholders are replaced with the app name and Python version."""
+    dockerfile = (streamlit_project / "app_src" / "Dockerfile").read_text()
     assert "python:3.13" in dockerfile, "Python version should be substituted in Dockerfile"
     assert "{{python_version}}" not in dockerfile, "Template placeholder should not remain"
 
-    app_pyproject = (project / "app_src" / "pyproject.toml").read_text()
+    app_pyproject = (streamlit_project / "app_src" / "pyproject.toml").read_text()
     assert "integ-test" in app_pyproject, "App name should be substituted in pyproject.toml"
     assert "{{app_name}}" not in app_pyproject, "Template placeholder should not remain"
 
-    # ---- Root pyproject.toml config ----
 
-    with open(project / "pyproject.toml", "rb") as f:
+def test_init_writes_webapp_config(streamlit_project):
+    """The root pyproject.toml records the framework and app name."""
+    with open(streamlit_project / "pyproject.toml", "rb") as f:
         root_config = tomllib.load(f)
 
     webapp = root_config.get("tool", {}).get("webapp", {})
     assert webapp.get("framework") == "streamlit"
     assert webapp.get("app_name") == "integ-test"
 
-    # ---- Manifest ----
 
-    manifest = read_manifest(project)
+def test_init_writes_manifest(streamlit_project):
+    """The manifest is written with file hashes for the tracked files."""
+    manifest = read_manifest(streamlit_project)
     assert manifest, "Manifest should be written"
     assert manifest["framework"] == "streamlit"
     assert manifest["app_name"] == "integ-test"
     assert "files" in manifest, "Manifest should contain file hashes"
     assert len(manifest["files"]) > 0, "Manifest should track at least one file"
 
-    # ---- Dependencies resolved ----
 
-    assert (project / "uv.lock").exists(), "uv.lock should be created by uv sync"
-    assert (project / ".venv").is_dir(), ".venv should be created by uv sync"
+def test_init_resolves_dependencies(streamlit_project):
+    """uv sync creates the lockfile and virtualenv."""
+    assert (streamlit_project / "uv.lock").exists(), "uv.lock should be created by uv sync"
+    assert (streamlit_project / ".venv").is_dir(), ".venv should be created by uv sync"
 
-    # ---- Git history ----
 
+def test_init_creates_initial_commit(streamlit_project):
+    """The scaffold is committed with a message naming the framework."""
     result = subprocess.run(
         ["git", "log", "--oneline"],
-        cwd=project,
+        cwd=streamlit_project,
         capture_output=True,
         text=True,
         check=True,
@@ -94,8 +106,9 @@ def test_init_streamlit_end_to_end(tmp_path):
     assert "Initial scaffold" in result.stdout, "Initial commit should exist"
     assert "streamlit" in result.stdout, "Commit message should mention the framework"
 
-    # ---- .gitignore ----
 
-    gitignore = (project / ".gitignore").read_text()
+def test_init_writes_gitignore(streamlit_project):
+    """The .gitignore excludes dev credentials and .new review files."""
+    gitignore = (streamlit_project / ".gitignore").read_text()
     assert ".aws-dev" in gitignore, ".aws-dev should be in gitignore"
     assert "*.new" in gitignore, "*.new files should be in gitignore"
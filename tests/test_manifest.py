@@ -1,17 +1,36 @@
 """Tests for manifest module."""
 
-import hashlib
+import shutil
+import tracemalloc
 
 import pytest
 
 from gds_idea_app_kit.manifest import (
     build_manifest,
     get_tracked_files,
+    hash_bytes,
     hash_file,
+    hash_matches,
+    load_pyproject,
     read_manifest,
     write_manifest,
 )
 
+_FRAMEWORKS = ("streamlit", "dash", "fastapi")
+
+# Every tool-owned file of a streamlit project, with placeholder content.
+_TRACKED_PROJECT_FILES = (
+    ("app_src/Dockerfile", "FROM python:3.13-slim"),
+    (".devcontainer/devcontainer.json", "{}"),
+    (".devcontainer/docker-compose.yml", "services:"),
+    (".github/workflows/ci_cd_cdk_app.yml", "name: CI/CD"),
+    (".github/workflows/ci_pr_cdk_app.yml", "name: CI PR"),
+    (".github/dependabot.yml", "version: 2"),
+    ("LICENCE", "MIT"),
+    ("dev_mocks/dev_mock_authoriser.json", "{}"),
+    ("dev_mocks/dev_mock_user.json", "{}"),
+)
+
 # ---- fixtures ----
 
 
@@ -23,31 +42,35 @@ def sample_file(tmp_path):
     return f
 
 
-@pytest.fixture()
-def tracked_project(project_dir):
-    """A project directory with all tool-owned files present."""
-    (project_dir / "app_src").mkdir()
-    (project_dir / "app_src" / "Dockerfile").write_text("FROM python:3.13-slim")
-    (project_dir / ".devcontainer").mkdir()
-    (project_dir / ".devcontainer" / "devcontainer.json").write_text("{}")
-    (project_dir / ".devcontainer" / "docker-compose.yml").write_text("services:")
-    (project_dir / ".github" / "workflows").mkdir(parents=True)
-    (project_dir / ".github" / "workflows" / "ci_cd_cdk_app.yml").write_text("name: CI/CD")
-    (project_dir / ".github" / "workflows" / "ci_pr_cdk_app.yml").write_text("name: CI PR")
-    (project_dir / ".github" / "dependabot.yml").write_text("version: 2")
-    (project_dir / "LICENCE").write_text("MIT")
-    (project_dir / "dev_mocks").mkdir()
-    (project_dir / "dev_mocks" / "dev_mock_authoriser.json").write_text("{}")
-    (project_dir / "dev_mocks" / "dev_mock_user.json").write_text("{}")
+@pytest.fixture(scope="module")
+def tracked_project_template(tmp_path_factory):
+    """A project directory with all tool-owned files present, built once per module.
+
+    Shared between tests, so only use it directly in tests that don't write to it.
+    """
+    project_dir = tmp_path_factory.mktemp("tracked_project")
+    (project_dir / "pyproject.toml").write_text(
+        '[project]\nname = "test-app"\nversion = "0.1.0"\n\n[tool]\n'
+    )
+    for rel_path, content in _TRACKED_PROJECT_FILES:
+        path = project_dir / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
     return project_dir
 
 
+@pytest.fixture()
+def tracked_project(tracked_project_template, tmp_path):
+    """A private copy of tracked_project_template for tests that modify the project."""
+    return shutil.copytree(tracked_project_template, tmp_path / "project")
+
+
 # ---- hash_file ----
 
 
 def test_hash_file_returns_sha256_prefix(sample_file):
     result = hash_file(sample_file)
-    expected = f"sha256:{hashlib.sha256(b'hello world').hexdigest()}"
+    expected = "sha256:b94d27b9934d3e08a52e52d7da7dabfac484efe37a5380ee9088f7ace2efcde9"
     assert result == expected
 
 
@@ -70,7 +93,7 @@ def test_hash_file_same_content_gives_same_hash(tmp_path):
 def test_hash_file_empty(tmp_path):
     f = tmp_path / "empty.txt"
     f.write_text("")
-    expected = f"sha256:{hashlib.sha256(b'').hexdigest()}"
+    expected = "sha256:e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
     assert hash_file(f) == expected
 
 
@@ -78,16 +101,84 @@ def test_hash_file_binary(tmp_path):
     f = tmp_path / "bin.dat"
     data = b"\x00\x01\x02\xff"
     f.write_bytes(data)
-    expected = f"sha256:{hashlib.sha256(data).hexdigest()}"
+    expected = "sha256:3d1f57c984978ef98a18378c8166c1cb8ede02c03eeb6aee7e2f121dfeee3e56"
     assert hash_file(f) == expected
 
 
+def test_hash_file_streams_large_files(tmp_path):
+    """Large files are hashed in chunks rather than read into memory whole."""
+    f = tmp_path / "large.bin"
+    f.write_bytes(b"x" * 10_000_000)
+
+    tracemalloc.start()
+    try:
+        hash_file(f)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak < 1_000_000
+
+
+def test_hash_file_other_algorithm(sample_file):
+    """hash_file prefixes the digest with the algorithm it was asked to use."""
+    expected = (
+        "blake2b:021ced8799296ceca557832ab941a50b4a11f83478cf141f51f933f653ab9fbc"
+        "c05a037cddbed06e309bf334942c4e58cdf1a46e237911ccd7fcf9787cbc7fd0"
+    )
+    assert hash_file(sample_file, "blake2b") == expected
+
+
+# ---- hash_bytes ----
+
+
+def test_hash_bytes_matches_hash_file(sample_file):
+    """Hashing content in memory gives the same result as hashing it on disk."""
+    assert hash_bytes(b"hello world") == hash_file(sample_file)
+
+
+# ---- hash_matches ----
+
+
+def test_hash_matches_sha256(sample_file):
+    """An unchanged file matches its own SHA256 hash."""
+    assert hash_matches(sample_file, hash_file(sample_file))
+
+
+def test_hash_matches_other_algorithm_never_matches(sample_file):
+    """A correct digest recorded with an unsupported algorithm is not trusted."""
+    assert not hash_matches(sample_file, hash_file(sample_file, "md5"))
+
+
+def test_hash_matches_detects_change(sample_file):
+    """A file edited after hashing no longer matches the recorded hash."""
+    recorded = hash_file(sample_file)
+    sample_file.write_text("changed")
+    assert not hash_matches(sample_file, recorded)
+
+
+def test_hash_matches_unknown_algorithm(sample_file):
+    """A hash with an unknown algorithm prefix never matches."""
+    assert not hash_matches(sample_file, "nosuchalgo:abc123")
+
+
+def test_hash_matches_variable_length_algorithm(sample_file):
+    """A shake_* prefix is treated as not matching rather than raising."""
+    assert not hash_matches(sample_file, "shake_128:abc123")
+
+
+def test_hash_matches_unknown_algorithm_missing_file_raises(tmp_path):
+    """A missing file raises even when the recorded algorithm is unsupported."""
+    with pytest.raises(FileNotFoundError):
+        hash_matches(tmp_path / "missing.txt", "nosuchalgo:abc123")
+
+
 # ---- get_tracked_files ----
 
 
-@pytest.mark.parametrize("framework", ["streamlit", "dash", "fastapi"])
-def test_tracked_files_include_common_destinations(framework):
-    tracked = get_tracked_files(framework)
+@pytest.mark.parametrize("framework", _FRAMEWORKS)
+def test_tracked_files_include_common_destinations(tracked_by_framework, framework):
+    tracked = tracked_by_framework[framework]
     destinations = set(tracked.values())
     assert ".github/workflows/ci_cd_cdk_app.yml" in destinations
     assert ".github/workflows/ci_pr_cdk_app.yml" in destinations
@@ -100,20 +191,27 @@ def test_tracked_files_include_common_destinations(framework):
     assert "app_src/Dockerfile" in destinations
 
 
-@pytest.mark.parametrize("framework", ["streamlit", "dash", "fastapi"])
-def test_tracked_files_dockerfile_source_matches_framework(framework):
-    tracked = get_tracked_files(framework)
+@pytest.mark.parametrize("framework", _FRAMEWORKS)
+def test_tracked_files_dockerfile_source_matches_framework(tracked_by_framework, framework):
+    tracked = tracked_by_framework[framework]
     assert f"{framework}/Dockerfile" in tracked
 
 
-def test_tracked_files_differ_across_frameworks():
-    streamlit = get_tracked_files("streamlit")
-    fastapi = get_tracked_files("fastapi")
+def test_tracked_files_differ_across_frameworks(tracked_by_framework):
+    streamlit = tracked_by_framework["streamlit"]
+    fastapi = tracked_by_framework["fastapi"]
     assert "streamlit/Dockerfile" in streamlit
     assert "streamlit/Dockerfile" not in fastapi
     assert "fastapi/Dockerfile" in fastapi
 
 
+def test_tracked_files_returns_independent_copy():
+    """Modifying the returned mapping doesn't affect later calls."""
+    tracked = get_tracked_files("streamlit")
+    tracked["extra/file"] = "extra/file"
+    assert "extra/file" not in get_tracked_files("streamlit")
+
+
 # ---- read_manifest ----
 
 
@@ -170,15 +268,27 @@ def test_write_manifest_overwrites_previous(project_with_manifest, sample_manife
     assert ".devcontainer/devcontainer.json" not in result["files"]
 
 
+def test_write_manifest_reuses_parsed_doc(project_with_manifest, sample_manifest):
+    """A document from load_pyproject can be read from and written back without re-parsing."""
+    doc = load_pyproject(project_with_manifest)
+    assert read_manifest(project_with_manifest, doc)["framework"] == "streamlit"
+
+    write_manifest(project_with_manifest, sample_manifest, doc)
+
+    result = read_manifest(project_with_manifest)
+    assert result["framework"] == "fastapi"
+    assert 'name = "test-app"' in (project_with_manifest / "pyproject.toml").read_text()
+
+
 # ---- build_manifest ----
 
 
-def test_build_manifest_hashes_all_tracked_files(tracked_project):
+def test_build_manifest_hashes_all_tracked_files(tracked_project_template):
     result = build_manifest(
         framework="streamlit",
         app_name="test-app",
         tool_version="0.1.0",
-        project_dir=tracked_project,
+        project_dir=tracked_project_template,
     )
     assert result["framework"] == "streamlit"
     assert result["app_name"] == "test-app"
@@ -213,10 +323,22 @@ def test_build_manifest_hash_matches_content(project_dir):
         tool_version="0.1.0",
         project_dir=project_dir,
     )
-    expected = f"sha256:{hashlib.sha256(content.encode()).hexdigest()}"
+    expected = "sha256:0dc3f04b9df68fa85d5a6e00c6e240958d26d511020d2bc8cdf2f99a3a71dca0"
     assert result["files"]["app_src/Dockerfile"] == expected
 
 
+def test_build_manifest_uses_precomputed_hashes(tracked_project_template):
+    """Precomputed hashes are used as given; other present files are hashed from disk."""
+    precomputed = {"app_src/Dockerfile": "sha256:precomputed"}
+    manifest = build_manifest("streamlit", "my-app", "0.1.0", tracked_project_template, precomputed)
+
+    files = manifest["files"]
+    assert files["app_src/Dockerfile"] == "sha256:precomputed"
+    assert files["LICENCE"] == hash_file(tracked_project_template / "LICENCE")
+    plain = build_manifest("streamlit", "my-app", "0.1.0", tracked_project_template)
+    assert list(files) == list(plain["files"])
+
+
 # ---- round-trip ----
 
 
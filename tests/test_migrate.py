@@ -1,7 +1,10 @@
 """Tests for the migrate command."""
 
-import os
+import copy
+import shutil
 import subprocess
+import tomllib
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
@@ -59,17 +62,29 @@ framework = "streamlit"
 """
 
 
+# Parsed once; tests get a deep copy through old_pyproject_doc.
+_OLD_PYPROJECT_DOC = tomlkit.parse(OLD_PYPROJECT)
+
+
 @pytest.fixture()
-def old_project(tmp_path):
-    """Create a mock old-style project with template/ directory and old pyproject.toml.
+def old_pyproject_doc():
+    """A fresh, modifiable tomlkit document of OLD_PYPROJECT."""
+    return copy.deepcopy(_OLD_PYPROJECT_DOC)
+
 
-    Returns the project directory path.
+@pytest.fixture(scope="module")
+def old_project_template(tmp_path_factory):
+    """A mock old-style project with template/ directory and old pyproject.toml.
+
+    Built once per module; tests get a private copy through old_project.
     """
+    project_dir = tmp_path_factory.mktemp("old_project")
+
     # Write old-style pyproject.toml
-    (tmp_path / "pyproject.toml").write_text(OLD_PYPROJECT)
+    (project_dir / "pyproject.toml").write_text(OLD_PYPROJECT)
 
     # Create template/ directory with scripts
-    template_dir = tmp_path / "template"
+    template_dir = project_dir / "template"
     template_dir.mkdir()
     (template_dir / "__init__.py").write_text("")
     (template_dir / "configure.py").write_text("def main(): pass")
@@ -77,7 +92,7 @@ def old_project(tmp_path):
     (template_dir / "provide_role.py").write_text("def main(): pass")
 
     # Create app_src/ with Dockerfile
-    app_src = tmp_path / "app_src"
+    app_src = project_dir / "app_src"
     app_src.mkdir()
     (app_src / "Dockerfile").write_text("FROM python:3.13-slim AS base\nWORKDIR /app\n")
     (app_src / "pyproject.toml").write_text(
@@ -86,54 +101,56 @@ def old_project(tmp_path):
     (app_src / "streamlit_app.py").write_text("import streamlit as st\n")
 
     # Create .devcontainer/
-    devcontainer = tmp_path / ".devcontainer"
+    devcontainer = project_dir / ".devcontainer"
     devcontainer.mkdir()
     (devcontainer / "devcontainer.json").write_text('{"name": "test"}')
     (devcontainer / "docker-compose.yml").write_text("services:\n  app:\n")
 
     # Create dev_mocks/
-    dev_mocks = tmp_path / "dev_mocks"
+    dev_mocks = project_dir / "dev_mocks"
     dev_mocks.mkdir()
     (dev_mocks / "dev_mock_authoriser.json").write_text("{}")
     (dev_mocks / "dev_mock_user.json").write_text("{}")
 
-    return tmp_path
-
+    return project_dir
 
-# ---- _detect_python_version ----
 
-
-def test_detect_python_version_from_dockerfile(tmp_path):
-    """Parses Python version from Dockerfile FROM line."""
-    app_src = tmp_path / "app_src"
-    app_src.mkdir()
-    (app_src / "Dockerfile").write_text("FROM python:3.13-slim AS base\n")
-
-    assert _detect_python_version(tmp_path) == "3.13"
+@pytest.fixture()
+def old_project(old_project_template, tmp_path):
+    """A private copy of old_project_template. Returns the project directory path."""
+    return shutil.copytree(old_project_template, tmp_path / "project")
 
 
-def test_detect_python_version_312_from_dockerfile(tmp_path):
-    """Parses a different Python version from Dockerfile."""
-    app_src = tmp_path / "app_src"
-    app_src.mkdir()
-    (app_src / "Dockerfile").write_text("FROM python:3.12-slim AS base\n")
-
-    assert _detect_python_version(tmp_path) == "3.12"
+# ---- _detect_python_version ----
 
 
-def test_detect_python_version_falls_back_to_pyproject(tmp_path):
-    """Falls back to app_src/pyproject.toml when Dockerfile has no version."""
+@pytest.mark.parametrize(
+    "dockerfile, pyproject, expected",
+    [
+        pytest.param("FROM python:3.13-slim AS base\n", None, "3.13", id="dockerfile"),
+        pytest.param("FROM python:3.12-slim AS base\n", None, "3.12", id="dockerfile-312"),
+        # Falls back to app_src/pyproject.toml when the Dockerfile has no version.
+        pytest.param(
+            "FROM ubuntu:latest\n",
+            '[project]\nrequires-python = ">=3.12"\n',
+            "3.12",
+            id="pyproject-fallback",
+        ),
+        # Defaults to 3.13 when no files can be parsed.
+        pytest.param(None, None, "3.13", id="default-no-files"),
+    ],
+)
+def test_detect_python_version(tmp_path, dockerfile, pyproject, expected):
+    """Detects the Python version from the Dockerfile, then app_src/pyproject.toml."""
     app_src = tmp_path / "app_src"
-    app_src.mkdir()
-    (app_src / "Dockerfile").write_text("FROM ubuntu:latest\n")
-    (app_src / "pyproject.toml").write_text('[project]\nrequires-python = ">=3.12"\n')
+    if dockerfile is not None or pyproject is not None:
+        app_src.mkdir()
+    if dockerfile is not None:
+        (app_src / "Dockerfile").write_text(dockerfile)
+    if pyproject is not None:
+        (app_src / "pyproject.toml").write_text(pyproject)
 
-    assert _detect_python_version(tmp_path) == "3.12"
-
-
-def test_detect_python_version_defaults_when_no_files(tmp_path):
-    """Defaults to 3.13 when no files can be parsed."""
-    assert _detect_python_version(tmp_path) == "3.13"
+    assert _detect_python_version(tmp_path) == expected
 
 
 # ---- _read_webapp_config ----
@@ -162,34 +179,32 @@ def test_read_webapp_config_exits_when_no_webapp(tmp_path):
 # ---- _remove_old_config ----
 
 
-def test_remove_old_config_removes_scripts_and_build(old_project):
+def test_remove_old_config_removes_scripts_and_build(old_pyproject_doc):
     """Removes [project.scripts], [build-system], [tool.uv.build-backend]."""
-    _remove_old_config(old_project)
-
-    with open(old_project / "pyproject.toml") as f:
-        config = tomlkit.load(f)
+    # project_dir is not read when a parsed document is passed in
+    config = _remove_old_config(Path("unused"), old_pyproject_doc)
 
     assert "build-system" not in config
     assert "scripts" not in config.get("project", {})
     assert "build-backend" not in config.get("tool", {}).get("uv", {})
 
 
-def test_remove_old_config_sets_package_false(old_project):
+def test_remove_old_config_sets_package_false(old_pyproject_doc):
     """Sets package = false in [tool.uv]."""
-    _remove_old_config(old_project)
-
-    with open(old_project / "pyproject.toml") as f:
-        config = tomlkit.load(f)
+    config = _remove_old_config(Path("unused"), old_pyproject_doc)
 
     assert config["tool"]["uv"]["package"] is False
 
 
 def test_remove_old_config_preserves_other_content(old_project):
-    """Preserves [project], [tool.webapp], [tool.webapp.dev], [tool.uv] dev-dependencies."""
+    """Preserves [project], [tool.webapp], [tool.webapp.dev], [tool.uv] dev-dependencies.
+
+    Called without a parsed document, so this also covers the write back to disk.
+    """
     _remove_old_config(old_project)
 
-    with open(old_project / "pyproject.toml") as f:
-        config = tomlkit.load(f)
+    with open(old_project / "pyproject.toml", "rb") as f:
+        config = tomllib.load(f)
 
     # Project metadata preserved
     assert config["project"]["name"] == "gds-idea-templates"
@@ -203,16 +218,11 @@ def test_remove_old_config_preserves_other_content(old_project):
     assert "pytest>=6.2.5" in config["tool"]["uv"]["dev-dependencies"]
 
 
-def test_remove_old_config_handles_missing_sections(tmp_path):
+def test_remove_old_config_handles_missing_sections():
     """Does not error when sections to remove don't exist."""
-    (tmp_path / "pyproject.toml").write_text(
-        '[project]\nname = "test"\n\n[tool.uv]\ndev-dependencies = []\n'
-    )
+    doc = tomlkit.parse('[project]\nname = "test"\n\n[tool.uv]\ndev-dependencies = []\n')
     # Should not raise
-    _remove_old_config(tmp_path)
-
-    with open(tmp_path / "pyproject.toml") as f:
-        config = tomlkit.load(f)
+    config = _remove_old_config(Path("unused"), doc)
 
     assert config["project"]["name"] == "test"
 
@@ -235,17 +245,15 @@ def test_remove_template_dir_no_error_when_missing(tmp_path):
 # ---- run_migrate integration ----
 
 
-def test_migrate_full_flow(old_project):
+def test_migrate_full_flow(old_project, monkeypatch):
     """Full migration creates manifest, removes old config, removes template/."""
-    os.chdir(old_project)
+    monkeypatch.chdir(old_project)
 
     # Simulate user confirming migration but declining update
     with (
-        patch("gds_idea_app_kit.migrate.click") as mock_click,
+        patch("gds_idea_app_kit.migrate.click", _ClickStub(confirm_continue_only)),
         patch("gds_idea_app_kit.migrate.subprocess.run") as mock_run,
     ):
-        mock_click.confirm = lambda msg, **kwargs: msg.startswith("Continue")
-        mock_click.echo = click_echo_noop
         mock_run.return_value = subprocess.CompletedProcess([], 0)
 
         run_migrate()
@@ -261,17 +269,17 @@ def test_migrate_full_flow(old_project):
     assert not (old_project / "template").exists()
 
     # Old config should be cleaned up
-    with open(old_project / "pyproject.toml") as f:
-        config = tomlkit.load(f)
+    with open(old_project / "pyproject.toml", "rb") as f:
+        config = tomllib.load(f)
 
     assert "build-system" not in config
     assert "scripts" not in config.get("project", {})
     assert config["tool"]["uv"]["package"] is False
 
 
-def test_migrate_exits_when_already_migrated(old_project, capsys):
+def test_migrate_exits_when_already_migrated(old_project, capsys, monkeypatch):
     """Exits with message when manifest already exists."""
-    os.chdir(old_project)
+    monkeypatch.chdir(old_project)
 
     # Write a manifest to simulate already-migrated project
     from gds_idea_app_kit.manifest import build_manifest, write_manifest
@@ -291,17 +299,14 @@ def test_migrate_exits_when_already_migrated(old_project, capsys):
     assert "already been migrated" in captured.err
 
 
-def test_migrate_aborts_on_decline(old_project):
+def test_migrate_aborts_on_decline(old_project, monkeypatch):
     """No changes are made when user declines the confirmation."""
-    os.chdir(old_project)
+    monkeypatch.chdir(old_project)
 
     # Read pyproject.toml before
     original_content = (old_project / "pyproject.toml").read_text()
 
-    with patch("gds_idea_app_kit.migrate.click") as mock_click:
-        mock_click.confirm = lambda msg, **kwargs: False
-        mock_click.echo = click_echo_noop
-
+    with patch("gds_idea_app_kit.migrate.click", _ClickStub(lambda msg, **kwargs: False)):
         run_migrate()
 
     # pyproject.toml should be unchanged
@@ -317,23 +322,25 @@ def test_migrate_aborts_on_decline(old_project):
 # ---- uv sync ----
 
 
-def test_migrate_runs_uv_sync(old_project):
+def test_migrate_runs_uv_sync(old_project, monkeypatch):
     """Migration runs 'uv sync' to remove old entry points from the environment."""
-    os.chdir(old_project)
+    monkeypatch.chdir(old_project)
 
     with (
-        patch("gds_idea_app_kit.migrate.click") as mock_click,
+        patch("gds_idea_app_kit.migrate.click", _ClickStub(confirm_continue_only)),
         patch("gds_idea_app_kit.migrate.subprocess.run") as mock_run,
     ):
-        mock_click.confirm = lambda msg, **kwargs: msg.startswith("Continue")
-        mock_click.echo = click_echo_noop
         mock_run.return_value = subprocess.CompletedProcess([], 0)
 
         run_migrate()
 
-    mock_run.assert_called_once_with(
-        ["uv", "sync"], cwd=old_project, check=True, capture_output=True, text=True
-    )
+    mock_run.assert_called_once()
+    call = mock_run.call_args
+    assert call.args[0] == ["uv", "sync"]
+    assert call.kwargs["cwd"] == old_project
+    assert call.kwargs["check"] is True
+    # uv's output streams to the terminal rather than being captured
+    assert "capture_output" not in call.kwargs
 
 
 # ---- helper ----
@@ -341,3 +348,20 @@ def test_migrate_runs_uv_sync(old_project):
 
 def click_echo_noop(*args, **kwargs):
     """No-op replacement for click.echo in tests."""
+
+
+def confirm_continue_only(msg, **kwargs):
+    """Confirm the migration prompt ("Continue?") but decline any follow-up prompt."""
+    return msg.startswith("Continue")
+
+
+class _ClickStub:
+    """Stand-in for the click module with just the functions migrate uses.
+
+    Unlike a MagicMock, any other click attribute migrate starts using raises
+    AttributeError instead of silently returning a mock.
+    """
+
+    def __init__(self, confirm):
+        self.confirm = confirm
+        self.echo = click_echo_noop
@@ -1,12 +1,17 @@
 """Tests for the prerequisites module."""
 
 import subprocess
-from unittest.mock import patch
+from unittest.mock import MagicMock
 
 import pytest
 
 from gds_idea_app_kit.prerequisites import PREREQUISITES, check_prerequisites
 
+# Lookup from each tool's check command to its display name.
+_CMD_TO_NAME: dict[tuple[str, ...], str] = {
+    tuple(check_cmd): name for name, check_cmd, _, _ in PREREQUISITES
+}
+
 
 def _make_side_effect(missing_names: set[str]):
     """Return a subprocess.run side_effect that fails for the given tool names.
@@ -15,42 +20,42 @@ def _make_side_effect(missing_names: set[str]):
         missing_names: Set of display names (e.g. {"docker compose"}) whose
             check commands should raise FileNotFoundError.
     """
-    # Build a lookup from the first element of each check_cmd to the name.
-    cmd_to_name: dict[tuple[str, ...], str] = {}
-    for name, check_cmd, _, _ in PREREQUISITES:
-        cmd_to_name[tuple(check_cmd)] = name
+    failing = frozenset(cmd for cmd, name in _CMD_TO_NAME.items() if name in missing_names)
 
     def side_effect(cmd, **kwargs):
-        key = tuple(cmd)
-        if key in cmd_to_name and cmd_to_name[key] in missing_names:
+        if tuple(cmd) in failing:
             raise FileNotFoundError(f"{cmd[0]} not found")
         return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
 
     return side_effect
 
 
+@pytest.fixture()
+def mock_run(monkeypatch):
+    """Replace subprocess.run in prerequisites with a mock that reports every tool present.
+
+    Tests set side_effect to simulate missing or failing tools.
+    """
+    mock = MagicMock(return_value=subprocess.CompletedProcess([], 0))
+    monkeypatch.setattr("gds_idea_app_kit.prerequisites.subprocess.run", mock)
+    return mock
+
+
 # ---- All tools present ----
 
 
-def test_all_present_does_not_exit():
+def test_all_present_does_not_exit(mock_run):
     """When all tools are found, check_prerequisites returns without error."""
-    with patch("gds_idea_app_kit.prerequisites.subprocess.run") as mock_run:
-        mock_run.return_value = subprocess.CompletedProcess([], 0)
-        check_prerequisites()  # should not raise
+    check_prerequisites()  # should not raise
 
 
 # ---- Single tool missing ----
 
 
-def test_single_missing_tool_exits(capsys):
+def test_single_missing_tool_exits(mock_run, capsys):
     """When one tool is missing, exits with an error naming that tool."""
-    with (
-        patch(
-            "gds_idea_app_kit.prerequisites.subprocess.run",
-            side_effect=_make_side_effect({"git"}),
-        ),
-        pytest.raises(SystemExit),
-    ):
+    mock_run.side_effect = _make_side_effect({"git"})
+    with pytest.raises(SystemExit):
         check_prerequisites()
 
     captured = capsys.readouterr()
@@ -61,15 +66,10 @@ def test_single_missing_tool_exits(capsys):
 # ---- Multiple tools missing ----
 
 
-def test_multiple_missing_tools_lists_all(capsys):
+def test_multiple_missing_tools_lists_all(mock_run, capsys):
     """When several tools are missing, all are listed in the error output."""
-    with (
-        patch(
-            "gds_idea_app_kit.prerequisites.subprocess.run",
-            side_effect=_make_side_effect({"cdk", "uv"}),
-        ),
-        pytest.raises(SystemExit),
-    ):
+    mock_run.side_effect = _make_side_effect({"cdk", "uv"})
+    with pytest.raises(SystemExit):
         check_prerequisites()
 
     captured = capsys.readouterr()
@@ -79,18 +79,24 @@ def test_multiple_missing_tools_lists_all(capsys):
     assert "brew install uv" in captured.err
 
 
+def test_missing_tools_reported_in_declared_order(mock_run, capsys):
+    """Missing tools are listed in PREREQUISITES order, even though checks run concurrently."""
+    mock_run.side_effect = _make_side_effect({"docker", "cdk", "git"})
+    with pytest.raises(SystemExit):
+        check_prerequisites()
+
+    err = capsys.readouterr().err
+    assert err.index("brew install aws-cdk") < err.index("brew install git")
+    assert err.index("brew install git") < err.index("brew install docker")
+
+
 # ---- docker compose missing shows URL ----
 
 
-def test_docker_compose_missing_shows_url(capsys):
+def test_docker_compose_missing_shows_url(mock_run, capsys):
     """When docker compose is missing, the error includes the troubleshooting URL."""
-    with (
-        patch(
-            "gds_idea_app_kit.prerequisites.subprocess.run",
-            side_effect=_make_side_effect({"docker compose"}),
-        ),
-        pytest.raises(SystemExit),
-    ):
+    mock_run.side_effect = _make_side_effect({"docker compose"})
+    with pytest.raises(SystemExit):
         check_prerequisites()
 
     captured = capsys.readouterr()
@@ -102,7 +108,7 @@ def test_docker_compose_missing_shows_url(capsys):
 # ---- CalledProcessError treated as missing ----
 
 
-def test_called_process_error_treated_as_missing(capsys):
+def test_called_process_error_treated_as_missing(mock_run, capsys):
     """A tool that exists but returns non-zero is treated as missing."""
 
     def side_effect(cmd, **kwargs):
@@ -110,10 +116,8 @@ def test_called_process_error_treated_as_missing(capsys):
             raise subprocess.CalledProcessError(1, cmd)
         return subprocess.CompletedProcess(cmd, 0)
 
-    with (
-        patch("gds_idea_app_kit.prerequisites.subprocess.run", side_effect=side_effect),
-        pytest.raises(SystemExit),
-    ):
+    mock_run.side_effect = side_effect
+    with pytest.raises(SystemExit):
         check_prerequisites()
 
     captured = capsys.readouterr()
@@ -123,7 +127,7 @@ def test_called_process_error_treated_as_missing(capsys):
 # ---- only parameter ----
 
 
-def test_only_filters_to_specified_tools():
+def test_only_filters_to_specified_tools(mock_run):
     """When only is given, tools not in the list are not checked."""
     calls = []
 
@@ -131,8 +135,8 @@ def test_only_filters_to_specified_tools():
         calls.append(tuple(cmd))
         return subprocess.CompletedProcess(cmd, 0)
 
-    with patch("gds_idea_app_kit.prerequisites.subprocess.run", side_effect=side_effect):
-        check_prerequisites(only=["docker", "docker compose"])
+    mock_run.side_effect = side_effect
+    check_prerequisites(only=["docker", "docker compose"])
 
     # Only docker and docker compose should have been checked
     assert ("docker", "--version") in calls
@@ -143,23 +147,16 @@ def test_only_filters_to_specified_tools():
     assert ("git", "--version") not in calls
 
 
-def test_only_missing_tool_still_exits(capsys):
+def test_only_missing_tool_still_exits(mock_run, capsys):
     """A filtered check still exits when the specified tool is missing."""
-    with (
-        patch(
-            "gds_idea_app_kit.prerequisites.subprocess.run",
-            side_effect=_make_side_effect({"docker compose"}),
-        ),
-        pytest.raises(SystemExit),
-    ):
+    mock_run.side_effect = _make_side_effect({"docker compose"})
+    with pytest.raises(SystemExit):
         check_prerequisites(only=["docker", "docker compose"])
 
     captured = capsys.readouterr()
     assert "docker compose" in captured.err
 
 
-def test_only_all_present_does_not_exit():
+def test_only_all_present_does_not_exit(mock_run):
     """A filtered check returns without error when all specified tools exist."""
-    with patch("gds_idea_app_kit.prerequisites.subprocess.run") as mock_run:
-        mock_run.return_value = subprocess.CompletedProcess([], 0)
-        check_prerequisites(only=["docker", "docker compose"])  # should not raise
+    check_prerequisites(only=["docker", "docker compose"])  # should not raise
@@ -0,0 +1,33 @@
+"""Tests for the shared [tool.webapp] reader."""
+
+import pytest
+
+from gds_idea_app_kit._pyproject import load_webapp_config
+
+
+def test_load_webapp_config_returns_webapp_table(tmp_path):
+    """Returns the [tool.webapp] table, including nested sub-tables."""
+    (tmp_path / "pyproject.toml").write_text(
+        '[project]\nname = "test"\n\n'
+        '[tool.webapp]\nframework = "dash"\napp_name = "my-app"\n\n'
+        '[tool.webapp.dev]\naws_region = "us-east-1"\n'
+    )
+
+    config = load_webapp_config(tmp_path)
+
+    assert config["framework"] == "dash"
+    assert config["app_name"] == "my-app"
+    assert config["dev"] == {"aws_region": "us-east-1"}
+
+
+def test_load_webapp_config_empty_when_section_missing(tmp_path):
+    """Returns an empty dict when there is no [tool.webapp] section."""
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "test"\n')
+
+    assert load_webapp_config(tmp_path) == {}
+
+
+def test_load_webapp_config_exits_when_no_pyproject(tmp_path):
+    """Exits with error when pyproject.toml doesn't exist."""
+    with pytest.raises(SystemExit):
+        load_webapp_config(tmp_path)
@@ -1,11 +1,18 @@
 """Tests for the smoke-test command."""
 
-import os
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from gds_idea_app_kit.smoke_test import _get_framework, _get_health_path, run_smoke_test
+from gds_idea_app_kit.smoke_test import (
+    _compose,
+    _get_framework,
+    _get_health_path,
+    _get_host_port,
+    _poll_health,
+    _show_failure_logs,
+    run_smoke_test,
+)
 
 # ---- _get_health_path ----
 
@@ -66,46 +73,126 @@ def test_get_framework_exits_when_framework_empty(tmp_path):
         _get_framework(tmp_path)
 
 
+# ---- _compose ----
+
+
+def test_compose_targets_production_image():
+    """docker compose runs against the compose file with DOCKER_TARGET=production."""
+    with patch("gds_idea_app_kit.smoke_test.subprocess.run") as mock_run:
+        _compose("build")
+
+    args, kwargs = mock_run.call_args
+    assert args[0] == ["docker", "compose", "-f", ".devcontainer/docker-compose.yml", "build"]
+    assert kwargs["env"]["DOCKER_TARGET"] == "production"
+
+
+# ---- _get_host_port ----
+
+
+@pytest.mark.parametrize("output", [b"0.0.0.0:49153\n", b":::49153\n"])
+def test_get_host_port_parses_ipv4_and_ipv6(output):
+    """The host port is taken from after the last colon of docker compose port output."""
+    with patch("gds_idea_app_kit.smoke_test._compose", return_value=MagicMock(stdout=output)):
+        assert _get_host_port() == "49153"
+
+
+# ---- _poll_health ----
+
+
+def test_poll_health_backs_off_between_checks():
+    """The wait between failed checks doubles until the endpoint responds."""
+    with (
+        patch("gds_idea_app_kit.smoke_test._check_health", side_effect=[False, False, True]),
+        patch("gds_idea_app_kit.smoke_test.time.sleep") as mock_sleep,
+    ):
+        assert _poll_health("http://localhost:8080/health") is True
+
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [0.1, 0.2]
+
+
+def test_poll_health_times_out():
+    """Returns False without sleeping once the timeout has already expired."""
+    with (
+        patch("gds_idea_app_kit.smoke_test._check_health", return_value=False),
+        patch("gds_idea_app_kit.smoke_test.time.sleep") as mock_sleep,
+    ):
+        assert _poll_health("http://localhost:8080/health", timeout=0) is False
+
+    mock_sleep.assert_not_called()
+
+
+# ---- _show_failure_logs ----
+
+
+def test_show_failure_logs_limits_output():
+    """Failure logs are capped to the last lines and printed without colour codes."""
+    with patch("gds_idea_app_kit.smoke_test._compose") as mock_compose:
+        _show_failure_logs()
+
+    mock_compose.assert_called_once_with(
+        "logs", "--tail", "200", "--no-color", stream=True, check=False
+    )
+
+
 # ---- run_smoke_test build_only ----
 
 
-def test_build_only_does_not_start_container(tmp_path):
-    """Build-only mode calls build but never starts a container or runs cleanup."""
-    pyproject = tmp_path / "pyproject.toml"
-    pyproject.write_text('[project]\nname = "test"\n\n[tool.webapp]\nframework = "streamlit"\n')
-    compose_file = tmp_path / ".devcontainer" / "docker-compose.yml"
+@pytest.fixture(scope="module")
+def smoke_project(tmp_path_factory):
+    """A streamlit project with a dev container compose file, built once per module.
+
+    run_smoke_test only reads the project (docker does the rest), so tests share it.
+    """
+    project_dir = tmp_path_factory.mktemp("smoke_project")
+    (project_dir / "pyproject.toml").write_text(
+        '[project]\nname = "test"\n\n[tool.webapp]\nframework = "streamlit"\n'
+    )
+    compose_file = project_dir / ".devcontainer" / "docker-compose.yml"
     compose_file.parent.mkdir(parents=True)
     compose_file.write_text("services:\n  app:\n")
+    return project_dir
+
 
-    os.chdir(tmp_path)
+def test_build_only_does_not_start_container(smoke_project, monkeypatch):
+    """Build-only mode calls build but never starts a container or runs cleanup."""
+    monkeypatch.chdir(smoke_project)
 
     with patch("gds_idea_app_kit.smoke_test._compose") as mock_compose:
         run_smoke_test(build_only=True)
 
-        # Build should have been called (via stream=True)
-        calls = [str(c) for c in mock_compose.call_args_list]
-        build_called = any("build" in c for c in calls)
-        assert build_called
+    # Compare subcommands exactly rather than substring-matching call reprs,
+    # which would match any argument that merely contains "up" or "down".
+    subcommands = [c.args[0] for c in mock_compose.call_args_list if c.args]
+    assert "build" in subcommands
+    assert "up" not in subcommands
+    assert "down" not in subcommands
 
-        # up and down should NOT have been called
-        up_called = any("up" in c for c in calls)
-        down_called = any("down" in c for c in calls)
-        assert not up_called
-        assert not down_called
+
+# ---- run_smoke_test full run ----
+
+
+def test_full_run_builds_and_starts_in_one_call(smoke_project, monkeypatch):
+    """A full run uses a single "up --build -d" instead of separate build and up calls."""
+    monkeypatch.chdir(smoke_project)
+
+    with (
+        patch("gds_idea_app_kit.smoke_test.check_prerequisites"),
+        patch("gds_idea_app_kit.smoke_test._compose") as mock_compose,
+        patch("gds_idea_app_kit.smoke_test._get_host_port", return_value="8080"),
+        patch("gds_idea_app_kit.smoke_test._poll_health", return_value=True),
+    ):
+        run_smoke_test(build_only=False)
+
+    compose_args = [c.args for c in mock_compose.call_args_list]
+    assert compose_args == [("up", "--build", "-d"), ("down",)]
 
 
 # ---- run_smoke_test cleanup on failure ----
 
 
-def test_cleanup_runs_on_failure(tmp_path):
+def test_cleanup_runs_on_failure(smoke_project, monkeypatch):
     """Cleanup runs even when an error occurs after the container starts."""
-    pyproject = tmp_path / "pyproject.toml"
-    pyproject.write_text('[project]\nname = "test"\n\n[tool.webapp]\nframework = "streamlit"\n')
-    compose_file = tmp_path / ".devcontainer" / "docker-compose.yml"
-    compose_file.parent.mkdir(parents=True)
-    compose_file.write_text("services:\n  app:\n")
-
-    os.chdir(tmp_path)
+    monkeypatch.chdir(smoke_project)
 
     compose_calls = []
 
@@ -113,11 +200,11 @@ def test_cleanup_runs_on_failure(tmp_path):
         compose_calls.append(args)
         if args and args[0] == "up":
             # Simulate successful up, then _get_host_port will fail
-            return MagicMock(stdout="0.0.0.0:8080\n")
+            return MagicMock(stdout=b"0.0.0.0:8080\n")
         if args and args[0] == "port":
             # After up succeeds, port query raises to simulate failure
             raise RuntimeError("simulated failure")
-        return MagicMock(stdout="")
+        return MagicMock(stdout=b"")
 
     with (
         patch("gds_idea_app_kit.smoke_test._compose", side_effect=fake_compose),
@@ -133,15 +220,9 @@ def test_cleanup_runs_on_failure(tmp_path):
 # ---- prerequisite check ----
 
 
-def test_smoke_test_checks_docker_prerequisites(tmp_path):
+def test_smoke_test_checks_docker_prerequisites(smoke_project, monkeypatch):
     """run_smoke_test calls check_prerequisites for docker and docker compose."""
-    pyproject = tmp_path / "pyproject.toml"
-    pyproject.write_text('[project]\nname = "test"\n\n[tool.webapp]\nframework = "streamlit"\n')
-    compose_file = tmp_path / ".devcontainer" / "docker-compose.yml"
-    compose_file.parent.mkdir(parents=True)
-    compose_file.write_text("services:\n  app:\n")
-
-    os.chdir(tmp_path)
+    monkeypatch.chdir(smoke_project)
 
     with (
         patch("gds_idea_app_kit.smoke_test.check_prerequisites") as mock_prereqs,
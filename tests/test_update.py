@@ -1,15 +1,15 @@
 """Tests for the update command."""
 
-import os
+import contextlib
+import io
+import shutil
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 
-from gds_idea_app_kit.init import _apply_template_vars, _get_templates_dir
 from gds_idea_app_kit.manifest import (
     build_manifest,
-    get_tracked_files,
+    hash_bytes,
     hash_file,
     read_manifest,
     write_manifest,
@@ -22,80 +22,124 @@ from gds_idea_app_kit.update import (
     _classify_file,
     _parse_version,
     _plan_updates,
+    _render_template,
     _report_updates,
     run_update,
 )
 
+# The report block for a skipped app_src/Dockerfile, checked as a whole so the
+# path, .new path and diff command are verified together and in order.
+_DOCKERFILE_SKIPPED_REPORT = (
+    "  Skipped: app_src/Dockerfile (locally modified)\n"
+    "    New version written to: app_src/Dockerfile.new\n"
+    "    Review changes: diff app_src/Dockerfile app_src/Dockerfile.new\n"
+)
+
 # ---- fixtures ----
 
 
-@pytest.fixture()
-def update_project(tmp_path):
-    """Create a project directory with manifest and all tracked files for streamlit.
+@pytest.fixture(scope="module")
+def update_project_template(tmp_path_factory, templates_dir, tracked_by_framework):
+    """A streamlit project with manifest and all tracked files, built once per module.
 
-    Returns the project directory path.
+    Tests get a private copy through update_project or plan_project.
     """
+    project_dir = tmp_path_factory.mktemp("update_project")
     framework = "streamlit"
     app_name = "test-app"
-    templates_dir = _get_templates_dir()
-    tracked = get_tracked_files(framework)
+    tracked = tracked_by_framework[framework]
     template_vars = {
         "app_name": app_name,
         "python_version": "3.13",
         "python_version_nodot": "313",
     }
 
-    # Copy all tracked template files into the project
+    # Several tracked files share a directory, so create each one only once.
+    for parent in {(project_dir / dest_path).parent for dest_path in tracked.values()}:
+        parent.mkdir(parents=True, exist_ok=True)
+
+    # Copy all tracked template files into the project, hashing the rendered
+    # content as we go so the manifest doesn't have to read the files back.
+    rendered_hashes = {}
     for template_src, dest_path in tracked.items():
-        template_full = templates_dir / template_src
-        dest_full = tmp_path / dest_path
-        dest_full.parent.mkdir(parents=True, exist_ok=True)
-        content = template_full.read_text()
-        content = _apply_template_vars(content, template_vars)
-        dest_full.write_text(content)
+        dest_full = project_dir / dest_path
+        content = _render_template(templates_dir / template_src, template_vars)
+        dest_full.write_bytes(content)
+        rendered_hashes[dest_path] = hash_bytes(content)
 
     # Write pyproject.toml with manifest
-    pyproject = tmp_path / "pyproject.toml"
+    pyproject = project_dir / "pyproject.toml"
     pyproject.write_text('[project]\nname = "test-app"\nversion = "0.1.0"\n\n[tool]\n')
 
     manifest = build_manifest(
         framework=framework,
         app_name=app_name,
         tool_version="0.1.0",
-        project_dir=tmp_path,
+        project_dir=project_dir,
+        precomputed_hashes=rendered_hashes,
     )
     manifest["python_version"] = "3.13"
-    write_manifest(tmp_path, manifest)
-
-    return tmp_path
+    write_manifest(project_dir, manifest)
 
+    return project_dir
 
-# ---- _parse_version ----
 
+@pytest.fixture()
+def update_project(update_project_template, tmp_path):
+    """A private copy of update_project_template.
 
-def test_parse_version_three_part():
-    """Parses a standard three-part version string."""
-    assert _parse_version("0.1.0") == (0, 1, 0)
+    Returns the project directory path.
+    """
+    return shutil.copytree(update_project_template, tmp_path / "project")
 
 
-def test_parse_version_two_part():
-    """Parses a two-part version string."""
-    assert _parse_version("1.0") == (1, 0)
+@pytest.fixture(scope="module")
+def modified_dockerfile_run(update_project_template, tmp_path_factory):
+    """One run_update over a project whose app_src/Dockerfile was edited locally.
 
+    Built once per module for tests that only inspect the result. Returns
+    (project_dir, stdout). Tests must treat the project as read-only.
+    """
+    project_dir = shutil.copytree(
+        update_project_template, tmp_path_factory.mktemp("modified_dockerfile") / "project"
+    )
+    (project_dir / "app_src" / "Dockerfile").write_text("# User modified this file\n")
 
-def test_parse_version_single():
-    """Parses a single-number version string."""
-    assert _parse_version("3") == (3,)
+    out = io.StringIO()
+    with pytest.MonkeyPatch.context() as mp, contextlib.redirect_stdout(out):
+        mp.chdir(project_dir)
+        run_update(dry_run=False)
+    return project_dir, out.getvalue()
 
 
-def test_parse_version_comparison_minor():
-    """Minor version bump compares correctly."""
-    assert _parse_version("0.1.0") < _parse_version("0.2.0")
+# ---- _parse_version ----
 
 
-def test_parse_version_comparison_patch():
-    """Patch version bump compares correctly."""
-    assert _parse_version("0.1.0") < _parse_version("0.1.1")
+@pytest.mark.parametrize(
+    "version, expected",
+    [
+        pytest.param("0.1.0", (0, 1, 0), id="three-part"),
+        pytest.param("1.0", (1, 0), id="two-part"),
+        pytest.param("3", (3,), id="single"),
+    ],
+)
+def test_parse_version(version, expected):
+    """Parses a dotted version string into a tuple of ints."""
+    assert _parse_version(version) == expected
+
+
+@pytest.mark.parametrize(
+    "lower, higher",
+    [
+        pytest.param("0.1.0", "0.2.0", id="minor"),
+        pytest.param("0.1.0", "0.1.1", id="patch"),
+        # Major version takes precedence over minor and patch.
+        pytest.param("1.9.9", "2.0.0", id="major-wins"),
+    ],
+)
+def test_parse_version_ordering(lower, higher):
+    """A version bump compares greater than the version before it."""
+    assert _parse_version(lower) < _parse_version(higher)
 
 
 def test_parse_version_comparison_equal():
@@ -103,62 +147,51 @@ def test_parse_version_comparison_equal():
     assert _parse_version("1.0.0") == _parse_version("1.0.0")
 
 
-def test_parse_version_comparison_major_wins():
-    """Major version takes precedence over minor and patch."""
-    assert _parse_version("2.0.0") > _parse_version("1.9.9")
-
-
 # ---- _check_version ----
 
 
-def test_check_version_older_tool_warns(capsys):
-    """When installed tool is older than manifest version, prints a warning."""
-    with patch("gds_idea_app_kit.update.__version__", "0.1.0"):
-        _check_version({"tool_version": "0.2.0"})
-
-    captured = capsys.readouterr()
-    assert "0.2.0" in captured.err
-    assert "upgrade" in captured.err
-
-
-def test_check_version_same_version_no_warning(capsys):
-    """When versions match, no warning is printed."""
-    with patch("gds_idea_app_kit.update.__version__", "0.1.0"):
-        _check_version({"tool_version": "0.1.0"})
-
-    captured = capsys.readouterr()
-    assert captured.err == ""
-
+@pytest.mark.parametrize(
+    "installed, manifest_version, warns",
+    [
+        pytest.param("0.1.0", "0.2.0", True, id="older-tool-warns"),
+        pytest.param("0.1.0", "0.1.0", False, id="same-version"),
+        pytest.param("0.2.0", "0.1.0", False, id="newer-tool"),
+    ],
+)
+def test_check_version(installed, manifest_version, warns, capsys, monkeypatch):
+    """Warns only when the installed tool is older than the manifest version."""
+    monkeypatch.setattr("gds_idea_app_kit.update.__version__", installed)
 
-def test_check_version_newer_tool_no_warning(capsys):
-    """When installed tool is newer, no warning is printed."""
-    with patch("gds_idea_app_kit.update.__version__", "0.2.0"):
-        _check_version({"tool_version": "0.1.0"})
+    _check_version({"tool_version": manifest_version})
 
     captured = capsys.readouterr()
-    assert captured.err == ""
+    if warns:
+        assert manifest_version in captured.err
+        assert "upgrade" in captured.err
+    else:
+        assert captured.err == ""
 
 
 # ---- run_update error cases ----
 
 
-def test_update_no_pyproject(tmp_path, capsys):
+def test_update_no_pyproject(tmp_path, capsys, monkeypatch):
     """Exit 1 when no pyproject.toml exists."""
+    monkeypatch.chdir(tmp_path)
     with pytest.raises(SystemExit):
-        os.chdir(tmp_path)
         run_update(dry_run=False)
 
     captured = capsys.readouterr()
     assert "No pyproject.toml" in captured.err
 
 
-def test_update_no_manifest(tmp_path, capsys):
+def test_update_no_manifest(tmp_path, capsys, monkeypatch):
     """Exit 1 when pyproject.toml has no manifest section."""
     pyproject = tmp_path / "pyproject.toml"
     pyproject.write_text('[project]\nname = "test-app"\n')
 
+    monkeypatch.chdir(tmp_path)
     with pytest.raises(SystemExit):
-        os.chdir(tmp_path)
         run_update(dry_run=False)
 
     captured = capsys.readouterr()
@@ -168,9 +201,9 @@ def test_update_no_manifest(tmp_path, capsys):
 # ---- run_update file handling ----
 
 
-def test_update_unchanged_files_get_overwritten(update_project, capsys):
+def test_update_unchanged_files_get_overwritten(update_project, capsys, monkeypatch):
     """Files whose hash matches the manifest are overwritten with latest template."""
-    os.chdir(update_project)
+    monkeypatch.chdir(update_project)
     run_update(dry_run=False)
 
     captured = capsys.readouterr()
@@ -179,50 +212,33 @@ def test_update_unchanged_files_get_overwritten(update_project, capsys):
     assert "Skipped:" not in captured.out
 
 
-def test_update_modified_file_writes_new(update_project, capsys):
+def test_update_modified_file_writes_new(modified_dockerfile_run):
     """Locally modified files get a .new file written alongside with review instructions."""
-    # Modify one tracked file
-    dockerfile = update_project / "app_src" / "Dockerfile"
-    dockerfile.write_text("# User modified this file\n")
+    _project_dir, out = modified_dockerfile_run
+    assert _DOCKERFILE_SKIPPED_REPORT in out
 
-    os.chdir(update_project)
-    run_update(dry_run=False)
 
-    captured = capsys.readouterr()
-    assert "Skipped: app_src/Dockerfile (locally modified)" in captured.out
-    assert "app_src/Dockerfile.new" in captured.out
-    assert "diff app_src/Dockerfile app_src/Dockerfile.new" in captured.out
-
-
-def test_update_modified_file_new_has_template_content(update_project):
+def test_update_modified_file_new_has_template_content(modified_dockerfile_run):
     """The .new file contains the latest template content, not the user's version."""
-    # Modify one tracked file
-    dockerfile = update_project / "app_src" / "Dockerfile"
-    dockerfile.write_text("# User modified this file\n")
+    project_dir, _out = modified_dockerfile_run
 
-    os.chdir(update_project)
-    run_update(dry_run=False)
-
-    new_file = update_project / "app_src" / "Dockerfile.new"
+    new_file = project_dir / "app_src" / "Dockerfile.new"
     assert new_file.exists()
-    content = new_file.read_text()
+    content = new_file.read_bytes()
     # Should have template content (Dockerfile starts with a comment header)
-    assert "# User modified" not in content
-    assert "FROM python:" in content
+    assert b"# User modified" not in content
+    assert b"FROM python:" in content
 
 
-def test_update_modified_file_original_unchanged(update_project):
+def test_update_modified_file_original_unchanged(modified_dockerfile_run):
     """The original modified file is not overwritten."""
-    dockerfile = update_project / "app_src" / "Dockerfile"
-    dockerfile.write_text("# User modified this file\n")
+    project_dir, _out = modified_dockerfile_run
 
-    os.chdir(update_project)
-    run_update(dry_run=False)
-
-    assert dockerfile.read_text() == "# User modified this file\n"
+    dockerfile = project_dir / "app_src" / "Dockerfile"
+    assert dockerfile.read_bytes() == b"# User modified this file\n"
 
 
-def test_update_modified_summary_count(update_project, capsys):
+def test_update_modified_summary_count(update_project, capsys, monkeypatch):
     """Summary line reports the count of locally modified files."""
     # Modify two tracked files
     dockerfile = update_project / "app_src" / "Dockerfile"
@@ -230,19 +246,19 @@ def test_update_modified_summary_count(update_project, capsys):
     devcontainer = update_project / ".devcontainer" / "devcontainer.json"
     devcontainer.write_text("// modified\n")
 
-    os.chdir(update_project)
+    monkeypatch.chdir(update_project)
     run_update(dry_run=False)
 
     captured = capsys.readouterr()
     assert "2 file(s) were locally modified and skipped" in captured.out
 
 
-def test_update_missing_file_is_created(update_project, capsys):
+def test_update_missing_file_is_created(update_project, capsys, monkeypatch):
     """Files missing from the project are created fresh."""
     dockerfile = update_project / "app_src" / "Dockerfile"
     dockerfile.unlink()
 
-    os.chdir(update_project)
+    monkeypatch.chdir(update_project)
     run_update(dry_run=False)
 
     captured = capsys.readouterr()
@@ -250,7 +266,7 @@ def test_update_missing_file_is_created(update_project, capsys):
     assert dockerfile.exists()
 
 
-def test_update_dry_run_makes_no_changes(update_project, capsys):
+def test_update_dry_run_makes_no_changes(update_project, capsys, monkeypatch):
     """Dry run reports what would change but doesn't modify files or write .new files."""
     # Delete a file and modify another
     dockerfile = update_project / "app_src" / "Dockerfile"
@@ -258,29 +274,29 @@ def test_update_dry_run_makes_no_changes(update_project, capsys):
     devcontainer = update_project / ".devcontainer" / "devcontainer.json"
     devcontainer.write_text("// modified\n")
 
-    manifest_before = read_manifest(update_project)
+    pyproject = update_project / "pyproject.toml"
+    pyproject_before = pyproject.read_bytes()
 
-    os.chdir(update_project)
+    monkeypatch.chdir(update_project)
     run_update(dry_run=True)
 
     # Deleted file should still be missing
     assert not dockerfile.exists()
     # No .new file should have been created
     assert not (update_project / ".devcontainer" / "devcontainer.json.new").exists()
-    # Manifest should be unchanged
-    manifest_after = read_manifest(update_project)
-    assert manifest_before == manifest_after
+    # pyproject.toml, and so the manifest, should be byte-for-byte unchanged
+    assert pyproject.read_bytes() == pyproject_before
 
     captured = capsys.readouterr()
     assert "No changes made (dry run)" in captured.out
 
 
-def test_update_manifest_is_refreshed_after_changes(update_project):
+def test_update_manifest_is_refreshed_after_changes(update_project, monkeypatch):
     """After updating files, the manifest hashes are refreshed."""
     dockerfile = update_project / "app_src" / "Dockerfile"
     dockerfile.unlink()
 
-    os.chdir(update_project)
+    monkeypatch.chdir(update_project)
     run_update(dry_run=False)
 
     manifest = read_manifest(update_project)
@@ -288,15 +304,29 @@ def test_update_manifest_is_refreshed_after_changes(update_project):
     assert hash_file(dockerfile) == manifest["files"]["app_src/Dockerfile"]
 
 
+def test_update_manifest_hashes_match_files_on_disk(update_project, monkeypatch):
+    """Manifest hashes match the files on disk, for both written and skipped files."""
+    (update_project / "app_src" / "Dockerfile").unlink()
+    devcontainer = update_project / ".devcontainer" / "devcontainer.json"
+    devcontainer.write_text("// modified\n")
+
+    monkeypatch.chdir(update_project)
+    run_update(dry_run=False)
+
+    files = read_manifest(update_project)["files"]
+    for dest_path, recorded in files.items():
+        assert recorded == hash_file(update_project / dest_path)
+
+
 # ---- run_update --force ----
 
 
-def test_update_force_overwrites_modified_file(update_project, capsys):
+def test_update_force_overwrites_modified_file(update_project, capsys, monkeypatch):
     """Force mode overwrites locally modified files instead of writing .new."""
     dockerfile = update_project / "app_src" / "Dockerfile"
     dockerfile.write_text("# User modified this file\n")
 
-    os.chdir(update_project)
+    monkeypatch.chdir(update_project)
     run_update(dry_run=False, force=True)
 
     captured = capsys.readouterr()
@@ -306,82 +336,138 @@ def test_update_force_overwrites_modified_file(update_project, capsys):
     # No .new file should be created
     assert not (update_project / "app_src" / "Dockerfile.new").exists()
     # Original should be overwritten with template content
-    assert "# User modified" not in dockerfile.read_text()
-    assert "FROM python:" in dockerfile.read_text()
+    content = dockerfile.read_bytes()
+    assert b"# User modified" not in content
+    assert b"FROM python:" in content
 
 
-def test_update_force_no_new_files_created(update_project):
+def test_update_force_no_new_files_created(update_project, tracked_by_framework, monkeypatch):
     """Force mode never creates .new files."""
+    tracked_dests = tracked_by_framework["streamlit"].values()
     # Modify all tracked files
-    for dest_path in get_tracked_files("streamlit").values():
+    for dest_path in tracked_dests:
         dest_full = update_project / dest_path
         if dest_full.exists():
             dest_full.write_text("# modified\n")
 
-    os.chdir(update_project)
+    monkeypatch.chdir(update_project)
     run_update(dry_run=False, force=True)
 
-    # No .new files anywhere
-    new_files = list(update_project.rglob("*.new"))
-    assert new_files == []
+    # update only ever writes .new files next to tracked files
+    stray = [d for d in tracked_dests if (update_project / f"{d}.new").exists()]
+    assert stray == []
 
 
-def test_update_force_updates_manifest(update_project):
+def test_update_force_updates_manifest(update_project, monkeypatch):
     """Force mode updates the manifest with new hashes after overwriting."""
     dockerfile = update_project / "app_src" / "Dockerfile"
     dockerfile.write_text("# User modified this file\n")
 
-    os.chdir(update_project)
+    monkeypatch.chdir(update_project)
     run_update(dry_run=False, force=True)
 
     manifest = read_manifest(update_project)
     assert hash_file(dockerfile) == manifest["files"]["app_src/Dockerfile"]
 
 
+# ---- _render_template ----
+
+
+def test_render_template_substitutes_variables(tmp_path):
+    """Placeholders are replaced and the result is returned as bytes."""
+    template = tmp_path / "Dockerfile"
+    template.write_text("FROM python:{{python_version}}-slim\n")
+
+    assert _render_template(template, {"python_version": "3.13"}) == b"FROM python:3.13-slim\n"
+
+
+def test_render_template_without_placeholders_is_verbatim(tmp_path):
+    """A template with no placeholders is returned byte-for-byte, line endings included."""
+    template = tmp_path / "LICENCE"
+    template.write_bytes(b"line one\r\nline two\r\n")
+
+    assert _render_template(template, {"app_name": "x"}) == b"line one\r\nline two\r\n"
+
+
 # ---- _classify_file ----
 
 
-def test_classify_missing_file_returns_create(tmp_path):
+@pytest.fixture(scope="module")
+def classify_dir(tmp_path_factory):
+    """One directory shared by the _classify_file tests; each test uses its own file name."""
+    return tmp_path_factory.mktemp("classify")
+
+
+def test_classify_missing_file_returns_create(classify_dir):
     """A file that doesn't exist on disk is classified as CREATE."""
-    dest_full = tmp_path / "missing.txt"
+    dest_full = classify_dir / "missing.txt"
     action = _classify_file(dest_full, {}, "missing.txt", force=False)
     assert action == Action.CREATE
 
 
-def test_classify_unchanged_file_returns_update(tmp_path):
+def test_classify_missing_file_in_manifest_returns_create(classify_dir):
+    """A file recorded in the manifest but deleted from disk is classified as CREATE."""
+    dest_full = classify_dir / "deleted.txt"
+    manifest_hashes = {"deleted.txt": "sha256:abc123"}
+    action = _classify_file(dest_full, manifest_hashes, "deleted.txt", force=False)
+    assert action == Action.CREATE
+
+
+def test_classify_unchanged_file_returns_update(classify_dir):
     """A file whose hash matches the manifest is classified as UPDATE."""
-    dest_full = tmp_path / "file.txt"
+    dest_full = classify_dir / "unchanged.txt"
     dest_full.write_text("original content")
     file_hash = hash_file(dest_full)
 
-    action = _classify_file(dest_full, {"file.txt": file_hash}, "file.txt", force=False)
+    action = _classify_file(dest_full, {"unchanged.txt": file_hash}, "unchanged.txt", force=False)
     assert action == Action.UPDATE
 
 
-def test_classify_modified_file_returns_skip(tmp_path):
+def test_classify_modified_file_returns_skip(classify_dir):
     """A file whose hash differs from the manifest is classified as SKIP."""
-    dest_full = tmp_path / "file.txt"
+    dest_full = classify_dir / "modified.txt"
     dest_full.write_text("modified content")
 
-    action = _classify_file(dest_full, {"file.txt": "old-hash"}, "file.txt", force=False)
+    action = _classify_file(dest_full, {"modified.txt": "old-hash"}, "modified.txt", force=False)
     assert action == Action.SKIP
 
 
-def test_classify_modified_file_with_force_returns_force(tmp_path):
+def test_classify_modified_file_with_force_returns_force(classify_dir):
     """A modified file with --force is classified as FORCE, not SKIP."""
-    dest_full = tmp_path / "file.txt"
+    dest_full = classify_dir / "forced.txt"
     dest_full.write_text("modified content")
 
-    action = _classify_file(dest_full, {"file.txt": "old-hash"}, "file.txt", force=True)
+    action = _classify_file(dest_full, {"forced.txt": "old-hash"}, "forced.txt", force=True)
     assert action == Action.FORCE
 
 
-def test_classify_file_not_in_manifest_returns_update(tmp_path):
+def test_classify_with_force_does_not_hash(classify_dir, monkeypatch):
+    """With --force, an existing tracked file is FORCE without being hashed."""
+    dest_full = classify_dir / "unhashed.txt"
+    dest_full.write_text("original content")
+    monkeypatch.setattr(
+        "gds_idea_app_kit.update.hash_matches",
+        lambda *args: pytest.fail("hash_matches should not be called"),
+    )
+
+    action = _classify_file(dest_full, {"unhashed.txt": "sha256:abc"}, "unhashed.txt", force=True)
+    assert action == Action.FORCE
+
+
+def test_classify_missing_file_with_force_returns_create(classify_dir):
+    """With --force, a tracked file missing from disk is still CREATE."""
+    dest_full = classify_dir / "gone.txt"
+
+    action = _classify_file(dest_full, {"gone.txt": "sha256:abc"}, "gone.txt", force=True)
+    assert action == Action.CREATE
+
+
+def test_classify_file_not_in_manifest_returns_update(classify_dir):
     """A file that exists but has no manifest entry is classified as UPDATE."""
-    dest_full = tmp_path / "file.txt"
+    dest_full = classify_dir / "untracked.txt"
     dest_full.write_text("some content")
 
-    action = _classify_file(dest_full, {}, "file.txt", force=False)
+    action = _classify_file(dest_full, {}, "untracked.txt", force=False)
     assert action == Action.UPDATE
 
 
@@ -389,43 +475,23 @@ def test_classify_file_not_in_manifest_returns_update(tmp_path):
 
 
 @pytest.fixture()
-def plan_project(tmp_path):
-    """Create a minimal project with templates for plan testing.
+def plan_project(update_project_template, templates_dir, tracked_by_framework, tmp_path):
+    """Create a project with templates for plan testing.
 
     Returns a dict with project_dir, templates_dir, tracked, template_vars,
-    and manifest_hashes for use in _plan_updates calls.
+    and manifest_hashes for use in _plan_updates calls. Each test gets its own
+    copy of the project files and of the tracked and manifest_hashes dicts.
     """
-    framework = "streamlit"
-    templates_dir = _get_templates_dir()
-    tracked = get_tracked_files(framework)
-    template_vars = {
-        "app_name": "test-app",
-        "python_version": "3.13",
-        "python_version_nodot": "313",
-    }
-
-    # Copy all tracked files into the project
-    for template_src, dest_path in tracked.items():
-        template_full = templates_dir / template_src
-        dest_full = tmp_path / dest_path
-        dest_full.parent.mkdir(parents=True, exist_ok=True)
-        content = template_full.read_text()
-        content = _apply_template_vars(content, template_vars)
-        dest_full.write_text(content)
-
-    # Build manifest hashes from the files we just wrote
-    manifest_hashes = {}
-    for _, dest_path in tracked.items():
-        dest_full = tmp_path / dest_path
-        if dest_full.exists():
-            manifest_hashes[dest_path] = hash_file(dest_full)
-
     return {
-        "project_dir": tmp_path,
-        "tracked": tracked,
+        "project_dir": shutil.copytree(update_project_template, tmp_path / "project"),
+        "tracked": dict(tracked_by_framework["streamlit"]),
         "templates_dir": templates_dir,
-        "template_vars": template_vars,
-        "manifest_hashes": manifest_hashes,
+        "template_vars": {
+            "app_name": "test-app",
+            "python_version": "3.13",
+            "python_version_nodot": "313",
+        },
+        "manifest_hashes": dict(read_manifest(update_project_template)["files"]),
     }
 
 
@@ -478,8 +544,8 @@ def test_plan_contains_rendered_content(plan_project):
 
     dockerfile_item = next(item for item in plan if item.dest_path == "app_src/Dockerfile")
     # Template variables should be substituted in the content
-    assert "{{app_name}}" not in dockerfile_item.new_content
-    assert "{{python_version}}" not in dockerfile_item.new_content
+    assert b"{{app_name}}" not in dockerfile_item.new_content
+    assert b"{{python_version}}" not in dockerfile_item.new_content
 
 
 def test_plan_skips_missing_templates(plan_project):
@@ -501,65 +567,69 @@ def test_plan_items_have_correct_dest_full(plan_project):
         assert item.dest_full == expected
 
 
-# ---- _apply_updates ----
-
+def test_plan_is_sorted_by_template_source(plan_project):
+    """The plan lists files in template-source order regardless of how they were processed."""
+    plan = _plan_updates(**plan_project, force=False)
 
-def test_apply_create_writes_file(tmp_path):
-    """CREATE action writes the file to disk."""
-    dest_full = tmp_path / "new_file.txt"
-    plan = [FileUpdate("new_file.txt", dest_full, "hello world", Action.CREATE)]
+    tracked = plan_project["tracked"]
+    expected = [dest for _, dest in sorted(tracked.items())]
+    assert [item.dest_path for item in plan] == expected
 
-    _apply_updates(plan)
 
-    assert dest_full.exists()
-    assert dest_full.read_text() == "hello world"
+def test_plan_empty_tracked_returns_empty(plan_project):
+    """No tracked files produces an empty plan."""
+    plan_project["tracked"] = {}
 
+    assert _plan_updates(**plan_project, force=False) == []
 
-def test_apply_create_makes_parent_dirs(tmp_path):
-    """CREATE action creates parent directories if needed."""
-    dest_full = tmp_path / "deep" / "nested" / "file.txt"
-    plan = [FileUpdate("deep/nested/file.txt", dest_full, "content", Action.CREATE)]
 
-    _apply_updates(plan)
+# ---- _apply_updates ----
 
-    assert dest_full.exists()
-    assert dest_full.read_text() == "content"
 
+def test_file_update_is_immutable(tmp_path):
+    """Planned updates can't be modified after planning."""
+    item = FileUpdate("file.txt", tmp_path / "file.txt", b"content", Action.CREATE)
 
-def test_apply_update_overwrites_file(tmp_path):
-    """UPDATE action overwrites an existing file."""
-    dest_full = tmp_path / "file.txt"
-    dest_full.write_text("old content")
-    plan = [FileUpdate("file.txt", dest_full, "new content", Action.UPDATE)]
+    with pytest.raises(AttributeError):
+        item.action = Action.SKIP
 
-    _apply_updates(plan)
 
-    assert dest_full.read_text() == "new content"
-
-
-def test_apply_force_overwrites_file(tmp_path):
-    """FORCE action overwrites an existing file."""
+@pytest.mark.parametrize(
+    "action, initial, expect_file, expect_new",
+    [
+        pytest.param(Action.CREATE, None, "template content", None, id="create-writes-file"),
+        pytest.param(Action.UPDATE, "old content", "template content", None, id="update"),
+        pytest.param(Action.FORCE, "user modified", "template content", None, id="force"),
+        # SKIP leaves the original alone and writes a .new file alongside
+        pytest.param(Action.SKIP, "user modified", "user modified", "template content", id="skip"),
+    ],
+)
+def test_apply_single_action(action, initial, expect_file, expect_new, tmp_path):
+    """Each action leaves the expected content in the file and its .new sibling."""
     dest_full = tmp_path / "file.txt"
-    dest_full.write_text("user modified")
-    plan = [FileUpdate("file.txt", dest_full, "template content", Action.FORCE)]
+    if initial is not None:
+        dest_full.write_text(initial)
+    plan = [FileUpdate("file.txt", dest_full, b"template content", action)]
 
     _apply_updates(plan)
 
-    assert dest_full.read_text() == "template content"
+    assert dest_full.read_text() == expect_file
+    new_file = tmp_path / "file.txt.new"
+    if expect_new is None:
+        assert not new_file.exists()
+    else:
+        assert new_file.read_text() == expect_new
 
 
-def test_apply_skip_writes_new_file(tmp_path):
-    """SKIP action writes a .new file alongside, leaving the original untouched."""
-    dest_full = tmp_path / "file.txt"
-    dest_full.write_text("user modified")
-    plan = [FileUpdate("file.txt", dest_full, "template content", Action.SKIP)]
+def test_apply_create_makes_parent_dirs(tmp_path):
+    """CREATE action creates parent directories if needed."""
+    dest_full = tmp_path / "deep" / "nested" / "file.txt"
+    plan = [FileUpdate("deep/nested/file.txt", dest_full, b"content", Action.CREATE)]
 
     _apply_updates(plan)
 
-    assert dest_full.read_text() == "user modified"
-    new_file = tmp_path / "file.txt.new"
-    assert new_file.exists()
-    assert new_file.read_text() == "template content"
+    assert dest_full.exists()
+    assert dest_full.read_text() == "content"
 
 
 def test_apply_mixed_actions(tmp_path):
@@ -571,9 +641,9 @@ def test_apply_mixed_actions(tmp_path):
     skip_file.write_text("user version")
 
     plan = [
-        FileUpdate("created.txt", create_file, "new file", Action.CREATE),
-        FileUpdate("updated.txt", update_file, "new version", Action.UPDATE),
-        FileUpdate("skipped.txt", skip_file, "template version", Action.SKIP),
+        FileUpdate("created.txt", create_file, b"new file", Action.CREATE),
+        FileUpdate("updated.txt", update_file, b"new version", Action.UPDATE),
+        FileUpdate("skipped.txt", skip_file, b"template version", Action.SKIP),
     ]
 
     _apply_updates(plan)
@@ -586,85 +656,74 @@ def test_apply_mixed_actions(tmp_path):
 
 # ---- _report_updates ----
 
-
-def test_report_created_files(capsys):
-    """Created files are reported with 'Created:' prefix."""
-    plan = [FileUpdate("app_src/Dockerfile", Path("/fake"), "", Action.CREATE)]
-
-    _report_updates(plan, dry_run=False)
-
-    captured = capsys.readouterr()
-    assert "Created: app_src/Dockerfile" in captured.out
-
-
-def test_report_updated_files(capsys):
-    """Updated files are reported with 'Updated:' prefix."""
-    plan = [FileUpdate("app_src/Dockerfile", Path("/fake"), "", Action.UPDATE)]
-
-    _report_updates(plan, dry_run=False)
-
-    captured = capsys.readouterr()
-    assert "Updated: app_src/Dockerfile" in captured.out
-
-
-def test_report_forced_files_show_as_updated(capsys):
-    """FORCE actions are reported as 'Updated:', not 'Forced:'."""
-    plan = [FileUpdate("app_src/Dockerfile", Path("/fake"), "", Action.FORCE)]
-
-    _report_updates(plan, dry_run=False)
-
-    captured = capsys.readouterr()
-    assert "Updated: app_src/Dockerfile" in captured.out
-
-
-def test_report_skipped_files_with_review_instructions(capsys):
-    """Skipped files show the path, .new path, and diff command."""
-    plan = [FileUpdate("app_src/Dockerfile", Path("/fake"), "", Action.SKIP)]
-
-    _report_updates(plan, dry_run=False)
-
-    captured = capsys.readouterr()
-    assert "Skipped: app_src/Dockerfile (locally modified)" in captured.out
-    assert "app_src/Dockerfile.new" in captured.out
-    assert "diff app_src/Dockerfile app_src/Dockerfile.new" in captured.out
-
-
-def test_report_skipped_summary_count(capsys):
-    """Summary reports the count of skipped files."""
-    plan = [
-        FileUpdate("file1.txt", Path("/fake1"), "", Action.SKIP),
-        FileUpdate("file2.txt", Path("/fake2"), "", Action.SKIP),
-    ]
-
-    _report_updates(plan, dry_run=False)
-
-    captured = capsys.readouterr()
-    assert "2 file(s) were locally modified and skipped" in captured.out
-
-
-def test_report_skipped_summary_not_shown_in_dry_run(capsys):
-    """Dry run does not show the 'locally modified and skipped' summary."""
-    plan = [FileUpdate("file.txt", Path("/fake"), "", Action.SKIP)]
-
-    _report_updates(plan, dry_run=True)
-
-    captured = capsys.readouterr()
-    assert "locally modified and skipped" not in captured.out
-
-
-def test_report_empty_plan(capsys):
-    """Empty plan reports 'Nothing to update.'."""
-    _report_updates([], dry_run=False)
-
-    captured = capsys.readouterr()
-    assert "Nothing to update." in captured.out
-
-
-def test_report_dry_run_footer(capsys):
-    """Dry run shows 'No changes made (dry run).' footer."""
-    plan = [FileUpdate("file.txt", Path("/fake"), "", Action.UPDATE)]
-
-    _report_updates(plan, dry_run=True)
-
-    captured = capsys.readouterr()
-    assert "No changes made (dry run)." in captured.out
+_FAKE = Path("/fake")
+
+
+@pytest.mark.parametrize(
+    "plan, dry_run, must_contain, must_not_contain",
+    [
+        pytest.param(
+            [FileUpdate("app_src/Dockerfile", _FAKE, b"", Action.CREATE)],
+            False,
+            ["Created: app_src/Dockerfile"],
+            [],
+            id="created",
+        ),
+        pytest.param(
+            [FileUpdate("app_src/Dockerfile", _FAKE, b"", Action.UPDATE)],
+            False,
+            ["Updated: app_src/Dockerfile"],
+            [],
+            id="updated",
+        ),
+        # FORCE is reported as 'Updated:', not 'Forced:'
+        pytest.param(
+            [FileUpdate("app_src/Dockerfile", _FAKE, b"", Action.FORCE)],
+            False,
+            ["Updated: app_src/Dockerfile"],
+            ["Forced:"],
+            id="forced-shows-as-updated",
+        ),
+        pytest.param(
+            [FileUpdate("app_src/Dockerfile", _FAKE, b"", Action.SKIP)],
+            False,
+            [_DOCKERFILE_SKIPPED_REPORT],
+            [],
+            id="skipped-with-review-instructions",
+        ),
+        pytest.param(
+            [
+                FileUpdate("file1.txt", _FAKE / "1", b"", Action.SKIP),
+                FileUpdate("file2.txt", _FAKE / "2", b"", Action.SKIP),
+            ],
+            False,
+            ["2 file(s) were locally modified and skipped"],
+            [],
+            id="skipped-summary-count",
+        ),
+        pytest.param(
+            [FileUpdate("file.txt", _FAKE, b"", Action.SKIP)],
+            True,
+            [],
+            ["locally modified and skipped"],
+            id="no-skipped-summary-in-dry-run",
+        ),
+        pytest.param([], False, ["Nothing to update."], [], id="empty-plan"),
+        pytest.param(
+            [FileUpdate("file.txt", _FAKE, b"", Action.UPDATE)],
+            True,
+            ["No changes made (dry run)."],
+            [],
+            id="dry-run-footer",
+        ),
+    ],
+)
+def test_report_updates(plan, dry_run, must_contain, must_not_contain, capsys):
+    """The report lists each action and the right footer for the plan."""
+    _report_updates(plan, dry_run=dry_run)
+
+    out = capsys.readouterr().out
+    for text in must_contain:
+        assert text in out
+    for text in must_not_contain:
+        assert text not in out